@@ -8,45 +8,28 @@ from mcstatus.responses import BedrockStatusResponse, JavaStatusResponse
 async def status(host: str) -> JavaStatusResponse | BedrockStatusResponse:
     """Get status from server, which can be Java or Bedrock.
 
-    The function will ping server as Java and as Bedrock in one time, and return the first response.
+    The function will ping server as Java and as Bedrock in one time, and return the first successful response.
+    The other probe is cancelled as soon as one succeeds, so a server of either kind costs only one round trip.
     """
-    success_task = await handle_exceptions(
-        *(
-            await asyncio.wait(
-                {
-                    asyncio.create_task(handle_java(host), name="Get status as Java"),
-                    asyncio.create_task(handle_bedrock(host), name="Get status as Bedrock"),
-                },
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-        )
-    )
-
-    if success_task is None:
-        raise ValueError("No tasks were successful. Is server offline?")
-
-    return success_task.result()
-
-
-async def handle_exceptions(done: set[asyncio.Task], pending: set[asyncio.Task]) -> asyncio.Task | None:
-    """Handle exceptions from tasks.
-
-    Also, cancel all pending tasks, if found correct one.
-    """
-    if len(done) == 0:
-        raise ValueError("No tasks was given to `done` set.")
-
-    for i, task in enumerate(done):
-        if task.exception() is not None:
-            if len(pending) == 0:
-                continue
-
-            if i == len(done) - 1:  # firstly check all items from `done` set, and then handle pending set
-                return await handle_exceptions(*(await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)))
-        else:
-            for pending_task in pending:
-                pending_task.cancel()
-            return task
+    tasks = {
+        asyncio.create_task(handle_java(host), name="Get status as Java"),
+        asyncio.create_task(handle_bedrock(host), name="Get status as Bedrock"),
+    }
+
+    try:
+        pending = tasks
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancelled probes to finish, without swallowing a cancellation of this coroutine itself
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    raise ValueError("No tasks were successful. Is server offline?")
 
 
 async def handle_java(host: str) -> JavaStatusResponse:
@@ -1,3 +1,5 @@
+import os
+
 from mcstatus.server import BedrockServer, JavaServer, MCServer
 
 __all__ = [
@@ -5,3 +7,14 @@ __all__ = [
     "JavaServer",
     "MCServer",
 ]
+
+# Switching the event loop policy affects the whole process, not just mcstatus, so it's opt-in only
+if os.environ.get("MCSTATUS_UVLOOP") == "1":
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports] # (Optional dependency)
+    except ImportError:
+        pass
+    else:
+        import asyncio
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,22 +1,96 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
-import sys
+import socket
+import time
 import warnings
+from collections.abc import Callable
 from pathlib import Path
-from typing import NamedTuple, TYPE_CHECKING
+from typing import Any, NamedTuple, TYPE_CHECKING
 from urllib.parse import urlparse
 
-import dns.resolver
-
-import mcstatus.dns
+from mcstatus.utils import SingleFlight
 
+# dnspython (used through mcstatus.dns) is only imported once a DNS query is actually needed,
+# as importing it takes longer than importing all of the rest of mcstatus together
 if TYPE_CHECKING:
+    import dns.asyncresolver
+    import dns.resolver
     from typing_extensions import Self
 
 
 __all__ = ("Address", "async_minecraft_srv_address_lookup", "minecraft_srv_address_lookup")
 
+# How many seconds an IP resolved from a hostname stays cached on an Address before it's resolved again
+_IP_CACHE_TTL = 300.0
+
+# Concurrent async lookups of the same name (with the same resolver) share a single DNS query, instead of each
+# sending their own
+_a_record_lookups: SingleFlight[str] = SingleFlight()
+_srv_lookups: SingleFlight[tuple[str, int]] = SingleFlight()
+
+
+def _is_ip(host: str) -> bool:
+    """Check whether the given host is an IP address (v4 or v6), rather than a hostname."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_localhost(host: str) -> bool:
+    """Check whether the given host is a localhost name, which always points to the loopback (RFC 6761)."""
+    name = host.lower().rstrip(".")
+    return name == "localhost" or name.endswith(".localhost")
+
+
+def _can_have_srv(host: str) -> bool:
+    """Check whether the given host could have an SRV record, which isn't the case for IP addresses and localhost."""
+    # Localhost names never get any records from DNS
+    if _is_localhost(host):
+        return False
+    return not _is_ip(host)
+
+
+def _pick_addrinfo_ip(addr_infos: list[tuple[Any, ...]]) -> str:
+    """Pick the IP from the results of :func:`socket.getaddrinfo`, preferring an IPv4 address if there's one."""
+    for family, _, _, _, sockaddr in addr_infos:
+        if family == socket.AF_INET:
+            return sockaddr[0]
+    return addr_infos[0][4][0]
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Cancel the task which is no longer needed, or if it already finished, mark its exception as retrieved."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+async def _async_resolve_host(host: str, lifetime: float | None, resolver: dns.asyncresolver.Resolver | None) -> str:
+    """Resolve the A record of given host, falling back to its AAAA record if the host doesn't have an A record.
+
+    The AAAA record is queried alongside the A record, so that falling back to it doesn't take another round trip,
+    but it's cancelled as soon as the A record is resolved (or fails with anything else than
+    :exc:`dns.resolver.NoAnswer`, which is then raised).
+    """
+    import dns.resolver
+
+    import mcstatus.dns
+
+    aaaa_lookup = asyncio.ensure_future(mcstatus.dns.async_resolve_aaaa_record(host, lifetime=lifetime, resolver=resolver))
+    try:
+        try:
+            return await mcstatus.dns.async_resolve_a_record(host, lifetime=lifetime, resolver=resolver)
+        except dns.resolver.NoAnswer:
+            # The host exists, but it might only have an IPv6 address
+            return await aaaa_lookup
+    finally:
+        _discard(aaaa_lookup)
+
 
 def _valid_urlparse(address: str) -> tuple[str, int | None]:
     """Parses a string address like 127.0.0.1:25565 into host and port parts
@@ -57,12 +131,14 @@ class Address(_AddressBase):
         The class is not a part of a Public API, but attributes :attr:`host` and :attr:`port` are a part of Public API.
     """
 
-    def __init__(self, host: str, port: int):
-        # We don't pass the host & port args to super's __init__, because NamedTuples handle
-        # everything from __new__ and the passed self already has all of the parameters set.
-        super().__init__()
+    # Tuple subclasses can't have slots for these, so they're only stored on the instance (creating
+    # its __dict__) once an IP actually gets resolved, until then, these class-level defaults are used.
+    _cached_ip: ipaddress.IPv4Address | ipaddress.IPv6Address | None = None
+    _cached_ip_expiry: float = 0.0
 
-        self._cached_ip: ipaddress.IPv4Address | ipaddress.IPv6Address | None = None
+    def __init__(self, host: str, port: int):
+        # We don't call super's __init__, because NamedTuples handle everything
+        # from __new__ and the passed self already has all of the parameters set.
 
         # Make sure the address is valid
         self._ensure_validity(self.host, self.port)
@@ -111,71 +187,123 @@ class Address(_AddressBase):
                 )
         return cls(host=hostname, port=port)
 
-    def resolve_ip(self, lifetime: float | None = None) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+    def _get_cached_ip(self) -> ipaddress.IPv4Address | ipaddress.IPv6Address | None:
+        """Get the already resolved IP address, if it's cached (and didn't expire yet), without resolving anything."""
+        if self._cached_ip is not None and time.monotonic() < self._cached_ip_expiry:
+            return self._cached_ip
+        return None
+
+    def resolve_ip(
+        self,
+        lifetime: float | None = None,
+        resolver: dns.resolver.Resolver | None = None,
+    ) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
         """Resolves a hostname's A record into an IP address.
 
         If the host is already an IP, this resolving is skipped
-        and host is returned directly.
+        and host is returned directly. If the host doesn't have
+        an A record, its AAAA record is used instead. Localhost
+        names aren't in DNS, so they're resolved by the OS instead.
+
+        The resolved IP is cached on this address for 5 minutes,
+        so repeated calls won't repeat the DNS query every time.
 
         :param lifetime:
             How many seconds a query should run before timing out.
             Default value for this is inherited from :func:`dns.resolver.resolve`.
+        :param resolver: The resolver to use, if not given, the default one from :mod:`dns.resolver` is used.
         :raises dns.exception.DNSException:
             One of the exceptions possibly raised by :func:`dns.resolver.resolve`.
             Most notably this will be :exc:`dns.exception.Timeout` and :exc:`dns.resolver.NXDOMAIN`
+        :raises socket.gaierror: The OS couldn't resolve a localhost name.
         """
-        if self._cached_ip is not None:
-            return self._cached_ip
-
-        host = self.host
-        if self.host == "localhost" and sys.platform == "darwin":
-            host = "127.0.0.1"
-            warnings.warn(
-                "On macOS because of some mysterious reasons we can't resolve localhost into IP. "
-                "Please, replace 'localhost' with '127.0.0.1' (or '::1' for IPv6) in your code to remove this warning.",
-                category=RuntimeWarning,
-                stacklevel=2,
-            )
+        return self._resolve_ip(lifetime, lambda: resolver)
+
+    def _resolve_ip(
+        self,
+        lifetime: float | None,
+        get_resolver: Callable[[], dns.resolver.Resolver | None],
+    ) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+        """Implementation of :meth:`.resolve_ip`, which only gets the resolver once a DNS query is actually needed."""
+        cached_ip = self._get_cached_ip()
+        if cached_ip is not None:
+            return cached_ip
 
         try:
-            ip = ipaddress.ip_address(host)
+            ip = ipaddress.ip_address(self.host)
         except ValueError:
             # ValueError is raised if the given address wasn't valid
             # this means it's a hostname and we should try to resolve
             # the A record
-            ip_addr = mcstatus.dns.resolve_a_record(self.host, lifetime=lifetime)
+            if _is_localhost(self.host):
+                # Localhost isn't in DNS, it's resolved by the OS (usually from the hosts file), so ask it directly
+                ip_addr = _pick_addrinfo_ip(socket.getaddrinfo(self.host, None, type=socket.SOCK_DGRAM))
+            else:
+                import dns.resolver
+
+                import mcstatus.dns
+
+                resolver = get_resolver()
+                try:
+                    ip_addr = mcstatus.dns.resolve_a_record(self.host, lifetime=lifetime, resolver=resolver)
+                except dns.resolver.NoAnswer:
+                    # The host exists, but it might only have an IPv6 address
+                    ip_addr = mcstatus.dns.resolve_aaaa_record(self.host, lifetime=lifetime, resolver=resolver)
             ip = ipaddress.ip_address(ip_addr)
+            # The A record can change, so only keep the resolved IP around for a while
+            self._cached_ip_expiry = time.monotonic() + _IP_CACHE_TTL
+        else:
+            # An IP literal will never resolve to anything else
+            self._cached_ip_expiry = float("inf")
 
         self._cached_ip = ip
         return self._cached_ip
 
-    async def async_resolve_ip(self, lifetime: float | None = None) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+    async def async_resolve_ip(
+        self,
+        lifetime: float | None = None,
+        resolver: dns.asyncresolver.Resolver | None = None,
+    ) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
         """Resolves a hostname's A record into an IP address.
 
         See the docstring for :meth:`.resolve_ip` for further info. This function is purely
-        an async alternative to it.
+        an async alternative to it, though it queries for the AAAA record alongside the A record
+        (cancelling it once the A record is resolved), so that a host without an A record doesn't
+        take another round trip.
         """
-        if self._cached_ip is not None:
-            return self._cached_ip
-
-        host = self.host
-        if self.host == "localhost" and sys.platform == "darwin":
-            host = "127.0.0.1"
-            warnings.warn(
-                "On macOS because of some mysterious reasons we can't resolve localhost into IP. "
-                "Please, replace 'localhost' with '127.0.0.1' (or '::1' for IPv6) in your code to remove this warning.",
-                category=RuntimeWarning,
-                stacklevel=2,
-            )
+        return await self._async_resolve_ip(lifetime, lambda: resolver)
+
+    async def _async_resolve_ip(
+        self,
+        lifetime: float | None,
+        get_resolver: Callable[[], dns.asyncresolver.Resolver | None],
+    ) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+        """Implementation of :meth:`.async_resolve_ip`, which only gets the resolver once a DNS query is actually needed."""
+        cached_ip = self._get_cached_ip()
+        if cached_ip is not None:
+            return cached_ip
 
         try:
-            ip = ipaddress.ip_address(host)
+            ip = ipaddress.ip_address(self.host)
         except ValueError:
             # ValueError is raised if the given address wasn't valid
             # this means it's a hostname and we should try to resolve
             # the A record
-            ip_addr = await mcstatus.dns.async_resolve_a_record(self.host, lifetime=lifetime)
+            if _is_localhost(self.host):
+                addr_infos = await asyncio.get_running_loop().getaddrinfo(self.host, None, type=socket.SOCK_DGRAM)
+                ip_addr = _pick_addrinfo_ip(addr_infos)
+            else:
+                resolver = get_resolver()
+                ip_addr = await _a_record_lookups.do(
+                    (self.host, lifetime, resolver),
+                    lambda: _async_resolve_host(self.host, lifetime, resolver),
+                )
             ip = ipaddress.ip_address(ip_addr)
+            # The A record can change, so only keep the resolved IP around for a while
+            self._cached_ip_expiry = time.monotonic() + _IP_CACHE_TTL
+        else:
+            # An IP literal will never resolve to anything else
+            self._cached_ip_expiry = float("inf")
 
         self._cached_ip = ip
         return self._cached_ip
@@ -186,6 +314,7 @@ def minecraft_srv_address_lookup(
     *,
     default_port: int | None = None,
     lifetime: float | None = None,
+    resolver: dns.resolver.Resolver | None = None,
 ) -> Address:
     """Lookup the SRV record for a Minecraft server.
 
@@ -203,9 +332,30 @@ def minecraft_srv_address_lookup(
     :param lifetime:
         How many seconds a query should run before timing out.
         Default value for this is inherited from :func:`dns.resolver.resolve`.
+    :param resolver: The resolver to use for the SRV query, if not given, the default one from :mod:`dns.resolver` is used.
     :raises ValueError:
         Either the address isn't valid and can't be parsed,
         or it lacks a port, SRV record isn't present, and ``default_port`` wasn't specified.
+
+    .. note::
+        The SRV query blocks, so calling this from a running event loop emits a :exc:`RuntimeWarning`,
+        use :func:`.async_minecraft_srv_address_lookup` there instead.
+    """
+    return _minecraft_srv_address_lookup(address, default_port=default_port, lifetime=lifetime, get_resolver=lambda: resolver)
+
+
+def _minecraft_srv_address_lookup(
+    address: str,
+    *,
+    default_port: int | None,
+    lifetime: float | None,
+    get_resolver: Callable[[], dns.resolver.Resolver | None],
+) -> Address:
+    """Implementation of :func:`.minecraft_srv_address_lookup`, which only gets the resolver once it's actually needed.
+
+    This has to be called directly from the public function which the user called (e.g. :meth:`JavaServer.lookup()
+    <mcstatus.server.JavaServer.lookup>`), so that the :exc:`RuntimeWarning` about blocking the event loop points
+    at the user's code.
     """
     host, port = _valid_urlparse(address)
 
@@ -213,11 +363,38 @@ def minecraft_srv_address_lookup(
     if port is not None:
         return Address(host, port)
 
+    # IPs (and localhost) can't have SRV records, so don't bother querying for one
+    if not _can_have_srv(host):
+        if default_port is None:
+            raise ValueError(
+                f"Given address '{address}' can't have an SRV record, it doesn't contain port,"
+                " and default_port wasn't specified, can't parse."
+            )
+        return Address(host, default_port)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # The query blocks, so nothing else can run on the loop until it's answered (or times out)
+        warnings.warn(
+            "Looking up an SRV record synchronously blocks the running event loop, "
+            "use the async alternative (e.g. JavaServer.async_lookup) instead.",
+            category=RuntimeWarning,
+            # Skip this function and the public one which called it
+            stacklevel=3,
+        )
+
+    import dns.resolver
+
+    import mcstatus.dns
+
     # Otherwise, try to check for an SRV record, pointing us to the
     # port which we should use. If there's no such record, fall back
     # to the default_port (if it's defined).
     try:
-        host, port = mcstatus.dns.resolve_mc_srv(host, lifetime=lifetime)
+        host, port = mcstatus.dns.resolve_mc_srv(host, lifetime=lifetime, resolver=get_resolver())
     except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
         if default_port is None:
             raise ValueError(
@@ -234,25 +411,76 @@ async def async_minecraft_srv_address_lookup(
     *,
     default_port: int | None = None,
     lifetime: float | None = None,
+    resolver: dns.asyncresolver.Resolver | None = None,
 ) -> Address:
     """Just an async alternative to :func:`.minecraft_srv_address_lookup`, check it for more details."""
+    return await _async_minecraft_srv_address_lookup(
+        address, default_port=default_port, lifetime=lifetime, get_resolver=lambda: resolver
+    )
+
+
+async def _async_minecraft_srv_address_lookup(
+    address: str,
+    *,
+    default_port: int | None,
+    lifetime: float | None,
+    get_resolver: Callable[[], dns.asyncresolver.Resolver | None],
+) -> Address:
+    """Implementation of :func:`.async_minecraft_srv_address_lookup`, which only gets the resolver once it's needed."""
     host, port = _valid_urlparse(address)
 
     # If we found a port in the address, there's nothing more we need
     if port is not None:
         return Address(host, port)
 
-    # Otherwise, try to check for an SRV record, pointing us to the
-    # port which we should use. If there's no such record, fall back
-    # to the default_port (if it's defined).
-    try:
-        host, port = await mcstatus.dns.async_resolve_mc_srv(host, lifetime=lifetime)
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+    # IPs (and localhost) can't have SRV records, so don't bother querying for one
+    if not _can_have_srv(host):
         if default_port is None:
             raise ValueError(
-                f"Given address '{address}' doesn't contain port, doesn't have an SRV record pointing to a port,"
+                f"Given address '{address}' can't have an SRV record, it doesn't contain port,"
                 " and default_port wasn't specified, can't parse."
             )
-        port = default_port
+        return Address(host, default_port)
 
-    return Address(host, port)
+    import dns.resolver
+
+    import mcstatus.dns
+
+    # Otherwise, try to check for an SRV record, pointing us to the
+    # port which we should use. If there's no such record, fall back
+    # to the default_port (if it's defined).
+    # Meanwhile, also resolve the IP of the host, as without an SRV
+    # record, that's where the server lives, and we save a round trip later.
+    hostname = host
+    resolver = get_resolver()
+    ip_lookup = asyncio.ensure_future(
+        _a_record_lookups.do((hostname, lifetime, resolver), lambda: _async_resolve_host(hostname, lifetime, resolver))
+    )
+    try:
+        try:
+            host, port = await _srv_lookups.do(
+                (hostname, lifetime, resolver),
+                lambda: mcstatus.dns.async_resolve_mc_srv(hostname, lifetime=lifetime, resolver=resolver),
+            )
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            if default_port is None:
+                raise ValueError(
+                    f"Given address '{address}' doesn't contain port, doesn't have an SRV record pointing to a port,"
+                    " and default_port wasn't specified, can't parse."
+                )
+            port = default_port
+
+        result = Address(host, port)
+        # The IP is only of any use if the server is on the same host, otherwise the lookup is cancelled
+        if host == hostname:
+            try:
+                ip_addr = await ip_lookup
+            except Exception:
+                # Resolving the IP is just a head start, any failure will show up again once it's actually needed
+                pass
+            else:
+                result._cached_ip = ipaddress.ip_address(ip_addr)
+                result._cached_ip_expiry = time.monotonic() + _IP_CACHE_TTL
+    finally:
+        _discard(ip_lookup)
+    return result
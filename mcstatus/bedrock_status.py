@@ -4,12 +4,19 @@ import asyncio
 import socket
 import struct
 from time import perf_counter
+from typing import TYPE_CHECKING
 
 import asyncio_dgram
 
 from mcstatus.address import Address
 from mcstatus.responses import BedrockStatusResponse
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# The length of the server name, which follows the fixed size header of the pong packet
+_NAME_LENGTH = struct.Struct(">H")
+
 
 class BedrockServerStatus:
     request_status_data = bytes.fromhex(
@@ -20,11 +27,35 @@ class BedrockServerStatus:
     def __init__(self, address: Address, timeout: float = 3):
         self.address = address
         self.timeout = timeout
+        # Within the (async) context manager, all of the requests share a single socket, instead of opening their own
+        self._socket: socket.socket | None = None
+        self._stream: asyncio_dgram.aio.DatagramClient | None = None
+        self._reuse_stream = False
+
+    def __enter__(self) -> Self:
+        self._socket = self._create_socket()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    async def __aenter__(self) -> Self:
+        # The stream is only opened by the first request, so that a failed connect gets retried along with the request
+        self._reuse_stream = True
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._reuse_stream = False
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
 
     @staticmethod
     def parse_response(data: bytes, latency: float) -> BedrockStatusResponse:
         data = data[1:]
-        name_length = struct.unpack(">H", data[32:34])[0]
+        name_length = _NAME_LENGTH.unpack_from(data, 32)[0]
         decoded_data = data[34 : 34 + name_length].decode().split(";")
 
         return BedrockStatusResponse.build(decoded_data, latency)
@@ -35,10 +66,19 @@ class BedrockServerStatus:
         end = perf_counter()
         return self.parse_response(data, (end - start) * 1000)
 
-    def _read_status(self) -> bytes:
+    def _create_socket(self) -> socket.socket:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.settimeout(self.timeout)
+        return s
+
+    def _read_status(self) -> bytes:
+        if self._socket is not None:
+            return self._request_status(self._socket)
 
+        with self._create_socket() as s:
+            return self._request_status(s)
+
+    def _request_status(self, s: socket.socket) -> bytes:
         s.sendto(self.request_status_data, self.address)
         data, _ = s.recvfrom(2048)
 
@@ -51,16 +91,26 @@ class BedrockServerStatus:
 
         return self.parse_response(data, (end - start) * 1000)
 
+    async def _connect_async(self) -> asyncio_dgram.aio.DatagramClient:
+        conn = asyncio_dgram.connect(self.address)
+        return await asyncio.wait_for(conn, timeout=self.timeout)
+
     async def _read_status_async(self) -> bytes:
+        if self._reuse_stream:
+            if self._stream is None:
+                self._stream = await self._connect_async()
+            return await self._request_status_async(self._stream)
+
         stream = None
         try:
-            conn = asyncio_dgram.connect(self.address)
-            stream = await asyncio.wait_for(conn, timeout=self.timeout)
-
-            await asyncio.wait_for(stream.send(self.request_status_data), timeout=self.timeout)
-            data, _ = await asyncio.wait_for(stream.recv(), timeout=self.timeout)
+            stream = await self._connect_async()
+            return await self._request_status_async(stream)
         finally:
             if stream is not None:
                 stream.close()
 
+    async def _request_status_async(self, stream: asyncio_dgram.aio.DatagramClient) -> bytes:
+        await asyncio.wait_for(stream.send(self.request_status_data), timeout=self.timeout)
+        data, _ = await asyncio.wait_for(stream.recv(), timeout=self.timeout)
+
         return data
@@ -6,20 +6,27 @@ import dns.asyncresolver
 import dns.resolver
 from dns.rdatatype import RdataType
 from dns.rdtypes.IN.A import A as ARecordAnswer
+from dns.rdtypes.IN.AAAA import AAAA as AAAARecordAnswer  # noqa: N811 # constant imported as non constant (it's class)
 from dns.rdtypes.IN.SRV import SRV as SRVRecordAnswer  # noqa: N811 # constant imported as non constant (it's class)
 
 
-def resolve_a_record(hostname: str, lifetime: float | None = None) -> str:
+def resolve_a_record(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.resolver.Resolver | None = None,
+) -> str:
     """Perform a DNS resolution for an A record to given hostname
 
     :param hostname: The address to resolve for.
+    :param resolver: The resolver to use, if not given, the default one from :mod:`dns.resolver` is used.
     :return: The resolved IP address from the A record
     :raises dns.exception.DNSException:
         One of the exceptions possibly raised by :func:`dns.resolver.resolve`.
         Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
         and :exc:`dns.resolver.NoAnswer`
     """
-    answers = dns.resolver.resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
+    resolve = dns.resolver.resolve if resolver is None else resolver.resolve
+    answers = resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(ARecordAnswer, answers[0])
@@ -27,12 +34,17 @@ def resolve_a_record(hostname: str, lifetime: float | None = None) -> str:
     return ip
 
 
-async def async_resolve_a_record(hostname: str, lifetime: float | None = None) -> str:
+async def async_resolve_a_record(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.asyncresolver.Resolver | None = None,
+) -> str:
     """Asynchronous alternative to :func:`.resolve_a_record`.
 
     For more details, check it.
     """
-    answers = await dns.asyncresolver.resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
+    resolve = dns.asyncresolver.resolve if resolver is None else resolver.resolve
+    answers = await resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(ARecordAnswer, answers[0])
@@ -40,17 +52,63 @@ async def async_resolve_a_record(hostname: str, lifetime: float | None = None) -
     return ip
 
 
-def resolve_srv_record(query_name: str, lifetime: float | None = None) -> tuple[str, int]:
+def resolve_aaaa_record(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.resolver.Resolver | None = None,
+) -> str:
+    """Perform a DNS resolution for an AAAA record to given hostname
+
+    :param hostname: The address to resolve for.
+    :param resolver: The resolver to use, if not given, the default one from :mod:`dns.resolver` is used.
+    :return: The resolved IPv6 address from the AAAA record
+    :raises dns.exception.DNSException:
+        One of the exceptions possibly raised by :func:`dns.resolver.resolve`.
+        Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
+        and :exc:`dns.resolver.NoAnswer`
+    """
+    resolve = dns.resolver.resolve if resolver is None else resolver.resolve
+    answers = resolve(hostname, RdataType.AAAA, lifetime=lifetime, search=True)
+    # Same as with A records, if there are multiple IPs, we just pick the first one
+    answer = cast(AAAARecordAnswer, answers[0])
+    ip = str(answer).rstrip(".")
+    return ip
+
+
+async def async_resolve_aaaa_record(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.asyncresolver.Resolver | None = None,
+) -> str:
+    """Asynchronous alternative to :func:`.resolve_aaaa_record`.
+
+    For more details, check it.
+    """
+    resolve = dns.asyncresolver.resolve if resolver is None else resolver.resolve
+    answers = await resolve(hostname, RdataType.AAAA, lifetime=lifetime, search=True)
+    # Same as with A records, if there are multiple IPs, we just pick the first one
+    answer = cast(AAAARecordAnswer, answers[0])
+    ip = str(answer).rstrip(".")
+    return ip
+
+
+def resolve_srv_record(
+    query_name: str,
+    lifetime: float | None = None,
+    resolver: dns.resolver.Resolver | None = None,
+) -> tuple[str, int]:
     """Perform a DNS resolution for SRV record pointing to the Java Server.
 
     :param query_name: The address to resolve for.
+    :param resolver: The resolver to use, if not given, the default one from :mod:`dns.resolver` is used.
     :return: A tuple of host string and port number
     :raises dns.exception.DNSException:
         One of the exceptions possibly raised by :func:`dns.resolver.resolve`.
         Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
         and :exc:`dns.resolver.NoAnswer`
     """
-    answers = dns.resolver.resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
+    resolve = dns.resolver.resolve if resolver is None else resolver.resolve
+    answers = resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(SRVRecordAnswer, answers[0])
@@ -59,12 +117,17 @@ def resolve_srv_record(query_name: str, lifetime: float | None = None) -> tuple[
     return host, port
 
 
-async def async_resolve_srv_record(query_name: str, lifetime: float | None = None) -> tuple[str, int]:
+async def async_resolve_srv_record(
+    query_name: str,
+    lifetime: float | None = None,
+    resolver: dns.asyncresolver.Resolver | None = None,
+) -> tuple[str, int]:
     """Asynchronous alternative to :func:`.resolve_srv_record`.
 
     For more details, check it.
     """
-    answers = await dns.asyncresolver.resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
+    resolve = dns.asyncresolver.resolve if resolver is None else resolver.resolve
+    answers = await resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(SRVRecordAnswer, answers[0])
@@ -73,22 +136,31 @@ async def async_resolve_srv_record(query_name: str, lifetime: float | None = Non
     return host, port
 
 
-def resolve_mc_srv(hostname: str, lifetime: float | None = None) -> tuple[str, int]:
+def resolve_mc_srv(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.resolver.Resolver | None = None,
+) -> tuple[str, int]:
     """Resolve SRV record for a minecraft server on given hostname.
 
     :param str hostname: The address, without port, on which an SRV record is present.
+    :param resolver: The resolver to use, if not given, the default one from :mod:`dns.resolver` is used.
     :return: Obtained target and port from the SRV record, on which the server should live on.
     :raises dns.exception.DNSException:
         One of the exceptions possibly raised by :func:`dns.resolver.resolve`.
         Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
         and :exc:`dns.resolver.NoAnswer`.
     """
-    return resolve_srv_record("_minecraft._tcp." + hostname, lifetime=lifetime)
+    return resolve_srv_record("_minecraft._tcp." + hostname, lifetime=lifetime, resolver=resolver)
 
 
-async def async_resolve_mc_srv(hostname: str, lifetime: float | None = None) -> tuple[str, int]:
+async def async_resolve_mc_srv(
+    hostname: str,
+    lifetime: float | None = None,
+    resolver: dns.asyncresolver.Resolver | None = None,
+) -> tuple[str, int]:
     """Asynchronous alternative to :func:`.resolve_mc_srv`.
 
     For more details, check it.
     """
-    return await async_resolve_srv_record("_minecraft._tcp." + hostname, lifetime=lifetime)
+    return await async_resolve_srv_record("_minecraft._tcp." + hostname, lifetime=lifetime, resolver=resolver)
@@ -19,6 +19,14 @@ __all__ = ["Motd"]
 
 MOTD_COLORS_RE = re.compile(r"([\xA7|&][0-9A-FK-OR])", re.IGNORECASE)
 
+# Components by their (lowercase) code, colors take precedence over formattings (though no code is used by both)
+_COMPONENTS_BY_CODE: dict[str, MinecraftColor | Formatting] = {
+    **{formatting.value: formatting for formatting in Formatting},
+    **{color.value: color for color in MinecraftColor},
+}
+# The keys of the formatting fields in dict MOTDs, along with their formatting, e.g. ("bold", Formatting.BOLD)
+_FORMATTING_KEYS: tuple[tuple[str, Formatting], ...] = tuple((member.name.lower(), member) for member in Formatting)
+
 
 @dataclass(frozen=True)
 class Motd:
@@ -83,14 +91,8 @@ class Motd:
                 continue
 
             if standardized_element.startswith("§"):
-                try:
-                    parsed_motd.append(MinecraftColor(clean_element))
-                except ValueError:
-                    try:
-                        parsed_motd.append(Formatting(clean_element))
-                    except ValueError:
-                        # just a text
-                        parsed_motd.append(element)
+                # If it isn't a known code, it's just a text
+                parsed_motd.append(_COMPONENTS_BY_CODE.get(clean_element, element))
             else:
                 parsed_motd.append(element)
 
@@ -118,15 +120,15 @@ class Motd:
         if (color := item.get("color")) is not None:
             parsed_motd.append(cls._parse_color(color))
 
-        for style_key, style_val in Formatting.__members__.items():
-            lowered_style_key = style_key.lower()
-            if item.get(lowered_style_key) is False:
+        for style_key, style_val in _FORMATTING_KEYS:
+            style_enabled = item.get(style_key)
+            if style_enabled is False:
                 try:
                     parsed_motd.remove(style_val)
                 except ValueError:
                     # some servers set the formatting keys to false here, even without it ever being set to true before
                     continue
-            elif item.get(lowered_style_key) is not None:
+            elif style_enabled is not None:
                 parsed_motd.append(style_val)
 
         if (text := item.get("text")) is not None:
@@ -136,7 +138,7 @@ class Motd:
         parsed_motd.append(Formatting.RESET)
 
         if "extra" in item:
-            auto_add = list(filter(lambda e: type(e) is Formatting and e != Formatting.RESET, parsed_motd))
+            auto_add = [e for e in parsed_motd if type(e) is Formatting and e is not Formatting.RESET]
 
             for element in item["extra"]:
                 parsed_motd.extend(
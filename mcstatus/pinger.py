@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import random
 from time import perf_counter
@@ -13,29 +14,67 @@ from mcstatus.protocol.connection import Connection, TCPAsyncSocketConnection, T
 from mcstatus.responses import JavaStatusResponse, RawJavaResponse
 
 
+# The status request packet (its length prefix and packet ID), it has no fields, so it's always the same
+_STATUS_REQUEST = bytes.fromhex("0100")
+
+
+def generate_ping_token() -> int:
+    """Generate a random token for the ping request, which the server has to send back."""
+    return random.randint(0, (1 << 63) - 1)
+
+
+def encode_handshake(address: Address, version: int) -> bytes:
+    """Encode the initial handshake packet (including its length prefix), ready to be written to a connection.
+
+    The packet only depends on the given arguments, so it can be reused for any amount of requests.
+    The recently encoded packets are cached, so encoding the same one again is almost free.
+    """
+    return _encode_handshake(address.host, address.port, version)
+
+
+@lru_cache(maxsize=1024)
+def _encode_handshake(host: str, port: int, version: int) -> bytes:
+    packet = Connection()
+    packet.write_varint(0)
+    packet.write_varint(version)
+    packet.write_utf(host)
+    packet.write_ushort(port)
+    packet.write_varint(1)  # Intention to query status
+
+    framed = Connection()
+    framed.write_buffer(packet)
+    return bytes(framed.flush())
+
+
 @dataclass
 class _BaseServerPinger(ABC):
     connection: TCPSocketConnection | TCPAsyncSocketConnection
     address: Address
     version: int = 47
-    ping_token: int = field(default_factory=lambda: random.randint(0, (1 << 63) - 1))
+    ping_token: int = field(default_factory=generate_ping_token)
 
     def handshake(self) -> None:
         """Writes the initial handshake packet to the connection."""
-        packet = Connection()
-        packet.write_varint(0)
-        packet.write_varint(self.version)
-        packet.write_utf(self.address.host)
-        packet.write_ushort(self.address.port)
-        packet.write_varint(1)  # Intention to query status
+        self.connection.write(encode_handshake(self.address, self.version))
+
+    def handshake_and_request_status(self) -> None:
+        """Writes the handshake packet, immediately followed by the status request, in a single write.
 
-        self.connection.write_buffer(packet)
+        This saves a separate send of the (tiny) status request, the response then has to be read
+        with :meth:`.read_status_response`.
+        """
+        self.connection.write(encode_handshake(self.address, self.version) + _STATUS_REQUEST)
 
     @abstractmethod
     def read_status(self) -> JavaStatusResponse | Awaitable[JavaStatusResponse]:
         """Make a status request and parse the response."""
         raise NotImplementedError
 
+    @abstractmethod
+    def read_status_response(self) -> JavaStatusResponse | Awaitable[JavaStatusResponse]:
+        """Read and parse the response to an already sent status request."""
+        raise NotImplementedError
+
     @abstractmethod
     def test_ping(self) -> float | Awaitable[float]:
         """Send a ping token and measure the latency."""
@@ -73,10 +112,11 @@ class ServerPinger(_BaseServerPinger):
 
     def read_status(self) -> JavaStatusResponse:
         """Send the status request and read the response."""
-        request = Connection()
-        request.write_varint(0)  # Request status
-        self.connection.write_buffer(request)
+        self.connection.write(_STATUS_REQUEST)
+        return self.read_status_response()
 
+    def read_status_response(self) -> JavaStatusResponse:
+        """Read and parse the response to an already sent status request."""
         start = perf_counter()
         response = self.connection.read_buffer()
         end = perf_counter()
@@ -102,10 +142,11 @@ class AsyncServerPinger(_BaseServerPinger):
 
     async def read_status(self) -> JavaStatusResponse:
         """Send the status request and read the response."""
-        request = Connection()
-        request.write_varint(0)  # Request status
-        self.connection.write_buffer(request)
+        self.connection.write(_STATUS_REQUEST)
+        return await self.read_status_response()
 
+    async def read_status_response(self) -> JavaStatusResponse:
+        """Read and parse the response to an already sent status request."""
         start = perf_counter()
         response = await self.connection.read_buffer()
         end = perf_counter()
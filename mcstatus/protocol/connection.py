@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import errno
+import inspect
 import socket
 import struct
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Iterable
 from ctypes import c_int32 as signed_int32
 from ctypes import c_int64 as signed_int64
@@ -13,8 +17,6 @@ from ctypes import c_uint64 as unsigned_int64
 from ipaddress import ip_address
 from typing import TYPE_CHECKING, cast
 
-import asyncio_dgram
-
 from mcstatus.address import Address
 
 if TYPE_CHECKING:
@@ -22,6 +24,57 @@ if TYPE_CHECKING:
 
     BytesConvertable: TypeAlias = "SupportsIndex | Iterable[SupportsIndex]"
 
+# Precompiled big-endian structs for the fixed size values, by their format character,
+# so that packing and unpacking doesn't have to look the format up again every time
+_STRUCTS = {format_: struct.Struct(">" + format_) for format_ in "?BhHiIqQ"}
+_UNSIGNED_BYTE = _STRUCTS["B"]
+
+# How many seconds to wait for a connection attempt to one address, before also trying the next one
+_HAPPY_EYEBALLS_DELAY = 0.25
+
+# How many seconds the addresses a hostname resolved into are reused for, before resolving it again
+_GETADDRINFO_TTL = 60.0
+# How many resolved hostnames are kept at most, the least recently used ones are dropped first
+_GETADDRINFO_CACHE_SIZE = 1024
+# Resolved (IP, port) pairs for TCP connections, by the (host, port) they were resolved for, along with their expiry
+_getaddrinfo_cache: OrderedDict[tuple[str, int], tuple[float, list[tuple[str, int]]]] = OrderedDict()
+# Connections can be opened from multiple threads (e.g. status_many), the cache is only ever touched with this lock held
+_getaddrinfo_cache_lock = threading.Lock()
+
+
+def _resolve_tcp_addresses(host: str, port: int) -> list[tuple[str, int]]:
+    """Resolve the host into the ``(IP, port)`` pairs to connect to, reusing the recent results for the same host."""
+    key = (host, port)
+    with _getaddrinfo_cache_lock:
+        cached = _getaddrinfo_cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                _getaddrinfo_cache.move_to_end(key)
+                return cached[1]
+            del _getaddrinfo_cache[key]
+
+    infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    addresses = [(cast(str, sockaddr[0]), port) for _, _, _, _, sockaddr in infos]
+    with _getaddrinfo_cache_lock:
+        _getaddrinfo_cache[key] = (time.monotonic() + _GETADDRINFO_TTL, addresses)
+        _getaddrinfo_cache.move_to_end(key)
+        if len(_getaddrinfo_cache) > _GETADDRINFO_CACHE_SIZE:
+            _getaddrinfo_cache.popitem(last=False)
+    return addresses
+
+
+def _supports_happy_eyeballs(loop: asyncio.AbstractEventLoop) -> bool:
+    """Check whether the ``create_connection`` of given event loop accepts the ``happy_eyeballs_delay`` argument.
+
+    Alternative event loops don't have to support it, uvloop for example raises :exc:`TypeError` on it.
+    """
+    try:
+        parameters = inspect.signature(loop.create_connection).parameters
+    except (TypeError, ValueError):
+        # The signature can't be inspected (e.g. it's implemented in C), don't risk passing the argument
+        return False
+    return "happy_eyeballs_delay" in parameters
+
 
 def ip_type(address: int | str) -> int | None:
     """Determinate what IP version is.
@@ -52,7 +105,7 @@ class BaseWriteSync(ABC):
     @staticmethod
     def _pack(format_: str, data: int) -> bytes:
         """Pack data in with format in big-endian mode."""
-        return struct.pack(">" + format_, data)
+        return _STRUCTS[format_].pack(data)
 
     def write_varint(self, value: int) -> None:
         """Write varint with value ``value`` to ``self``.
@@ -63,11 +116,11 @@ class BaseWriteSync(ABC):
         remaining = unsigned_int32(value).value
         for _ in range(5):
             if not remaining & -0x80:  # remaining & ~0x7F == 0:
-                self.write(struct.pack("!B", remaining))
+                self.write(_UNSIGNED_BYTE.pack(remaining))
                 if value > 2**31 - 1 or value < -(2**31):
                     break
                 return
-            self.write(struct.pack("!B", remaining & 0x7F | 0x80))
+            self.write(_UNSIGNED_BYTE.pack(remaining & 0x7F | 0x80))
             remaining >>= 7
         raise ValueError(f'The value "{value}" is too big to send in a varint')
 
@@ -80,11 +133,11 @@ class BaseWriteSync(ABC):
         remaining = unsigned_int64(value).value
         for _ in range(10):
             if not remaining & -0x80:  # remaining & ~0x7F == 0:
-                self.write(struct.pack("!B", remaining))
+                self.write(_UNSIGNED_BYTE.pack(remaining))
                 if value > 2**63 - 1 or value < -(2**31):
                     break
                 return
-            self.write(struct.pack("!B", remaining & 0x7F | 0x80))
+            self.write(_UNSIGNED_BYTE.pack(remaining & 0x7F | 0x80))
             remaining >>= 7
         raise ValueError(f'The value "{value}" is too big to send in a varlong')
 
@@ -148,7 +201,7 @@ class BaseWriteAsync(ABC):
     @staticmethod
     def _pack(format_: str, data: int) -> bytes:
         """Pack data in with format in big-endian mode."""
-        return struct.pack(">" + format_, data)
+        return _STRUCTS[format_].pack(data)
 
     async def write_varint(self, value: int) -> None:
         """Write varint with value ``value`` to ``self``.
@@ -159,11 +212,11 @@ class BaseWriteAsync(ABC):
         remaining = unsigned_int32(value).value
         for _ in range(5):
             if not remaining & -0x80:  # remaining & ~0x7F == 0:
-                await self.write(struct.pack("!B", remaining))
+                await self.write(_UNSIGNED_BYTE.pack(remaining))
                 if value > 2**31 - 1 or value < -(2**31):
                     break
                 return
-            await self.write(struct.pack("!B", remaining & 0x7F | 0x80))
+            await self.write(_UNSIGNED_BYTE.pack(remaining & 0x7F | 0x80))
             remaining >>= 7
         raise ValueError(f'The value "{value}" is too big to send in a varint')
 
@@ -176,11 +229,11 @@ class BaseWriteAsync(ABC):
         remaining = unsigned_int64(value).value
         for _ in range(10):
             if not remaining & -0x80:  # remaining & ~0x7F == 0:
-                await self.write(struct.pack("!B", remaining))
+                await self.write(_UNSIGNED_BYTE.pack(remaining))
                 if value > 2**63 - 1 or value < -(2**31):
                     break
                 return
-            await self.write(struct.pack("!B", remaining & 0x7F | 0x80))
+            await self.write(_UNSIGNED_BYTE.pack(remaining & 0x7F | 0x80))
             remaining >>= 7
         raise ValueError(f'The value "{value}" is too big to send in a varlong')
 
@@ -244,7 +297,7 @@ class BaseReadSync(ABC):
     @staticmethod
     def _unpack(format_: str, data: bytes) -> int:
         """Unpack data as bytes with format in big-endian."""
-        return struct.unpack(">" + format_, bytes(data))[0]
+        return _STRUCTS[format_].unpack(data)[0]
 
     def read_varint(self) -> int:
         """Read varint from ``self`` and return it.
@@ -337,7 +390,7 @@ class BaseReadAsync(ABC):
     @staticmethod
     def _unpack(format_: str, data: bytes) -> int:
         """Unpack data as bytes with format in big-endian."""
-        return struct.unpack(">" + format_, bytes(data))[0]
+        return _STRUCTS[format_].unpack(data)[0]
 
     async def read_varint(self) -> int:
         """Read varint from ``self`` and return it.
@@ -469,7 +522,19 @@ class Connection(BaseSyncConnection):
             raise IOError(f"Not enough data to read! {len(self.received)} < {length}")
 
         result = self.received[:length]
-        self.received = self.received[length:]
+        # Deleting from the start of a bytearray only moves its start, unlike slicing, which copies all of the rest
+        del self.received[:length]
+        return result
+
+    def read_ascii(self) -> str:
+        """Read ``self`` until last value is not zero, then return that decoded with ``ISO-8859-1``"""
+        # Find the null terminator at once, rather than reading byte by byte like the generic implementation
+        end = self.received.find(0)
+        if end == -1:
+            raise IOError(f"Not enough data to read! No null terminator in the remaining {len(self.received)} bytes")
+
+        result = self.received[:end].decode("ISO-8859-1")
+        del self.received[: end + 1]
         return result
 
     def write(self, data: Connection | str | bytearray | bytes) -> None:
@@ -531,23 +596,50 @@ class SocketConnection(BaseSyncConnection):
 
 
 class TCPSocketConnection(SocketConnection):
-    """TCP Connection to address. Timeout defaults to 3 seconds."""
+    """TCP Connection to address. Timeout defaults to 3 seconds.
+
+    Connecting is limited by ``connect_timeout`` instead, if it's given.
+    """
 
     __slots__ = ()
 
-    def __init__(self, addr: tuple[str | None, int], timeout: float = 3):
+    def __init__(self, addr: tuple[str | None, int], timeout: float = 3, connect_timeout: float | None = None):
         super().__init__()
-        self.socket = socket.create_connection(addr, timeout=timeout)
+        host, port = addr
+        if connect_timeout is None:
+            connect_timeout = timeout
+        if host is None or ip_type(host) is not None:
+            self.socket = socket.create_connection(addr, timeout=connect_timeout)
+        else:
+            self.socket = self._connect_any(_resolve_tcp_addresses(host, port), connect_timeout)
+        if connect_timeout != timeout:
+            self.socket.settimeout(timeout)
         self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
+    @staticmethod
+    def _connect_any(addresses: list[tuple[str, int]], timeout: float) -> socket.socket:
+        """Connect to the first of the addresses which accepts the connection, like :func:`socket.create_connection`."""
+        last_exc: OSError | None = None
+        for address in addresses:
+            try:
+                return socket.create_connection(address, timeout=timeout)
+            except OSError as exc:
+                last_exc = exc
+        if last_exc is None:
+            raise OSError(f"getaddrinfo returned no addresses to connect to for {addresses!r}")
+        raise last_exc
+
     def read(self, length: int) -> bytearray:
         """Return length bytes read from :attr:`.socket`. Raises :exc:`IOError` when server doesn't respond."""
-        result = bytearray()
-        while len(result) < length:
-            new = self.socket.recv(length - len(result))
-            if len(new) == 0:
+        # Receive straight into the preallocated result, without creating an intermediate bytes object per recv
+        result = bytearray(length)
+        view = memoryview(result)
+        received = 0
+        while received < length:
+            new = self.socket.recv_into(view[received:])
+            if new == 0:
                 raise IOError("Server did not respond with any information!")
-            result.extend(new)
+            received += new
         return result
 
     def write(self, data: Connection | str | bytes | bytearray) -> None:
@@ -596,19 +688,28 @@ class UDPSocketConnection(SocketConnection):
 class TCPAsyncSocketConnection(BaseAsyncReadSyncWriteConnection):
     """Asynchronous TCP Connection class"""
 
-    __slots__ = ("_addr", "reader", "timeout", "writer")
+    __slots__ = ("_addr", "connect_timeout", "reader", "timeout", "writer")
 
-    def __init__(self, addr: Address, timeout: float = 3) -> None:
+    def __init__(self, addr: Address, timeout: float = 3, connect_timeout: float | None = None) -> None:
         # These will only be None until connect is called, ignore the None type assignment
         self.reader: asyncio.StreamReader = None  # type: ignore[assignment]
         self.writer: asyncio.StreamWriter = None  # type: ignore[assignment]
         self.timeout: float = timeout
+        self.connect_timeout: float = timeout if connect_timeout is None else connect_timeout
         self._addr = addr
 
     async def connect(self) -> None:
-        """Use :mod:`asyncio` to open a connection to address. Timeout is in seconds."""
-        conn = asyncio.open_connection(*self._addr)
-        self.reader, self.writer = await asyncio.wait_for(conn, timeout=self.timeout)
+        """Use :mod:`asyncio` to open a connection to address. Timeout is in seconds.
+
+        Connecting is limited by :attr:`.connect_timeout`, the reads then by :attr:`.timeout`.
+        """
+        # When the host has both IPv6 and IPv4 addresses, don't wait out the whole timeout on an unreachable
+        # address family, start connecting to the next address after a short delay instead (RFC 8305)
+        if _supports_happy_eyeballs(asyncio.get_running_loop()):
+            conn = asyncio.open_connection(*self._addr, happy_eyeballs_delay=_HAPPY_EYEBALLS_DELAY)
+        else:
+            conn = asyncio.open_connection(*self._addr)
+        self.reader, self.writer = await asyncio.wait_for(conn, timeout=self.connect_timeout)
 
     async def read(self, length: int) -> bytearray:
         """Read up to ``length`` bytes from :attr:`.reader`."""
@@ -644,40 +745,62 @@ class TCPAsyncSocketConnection(BaseAsyncReadSyncWriteConnection):
 class UDPAsyncSocketConnection(BaseAsyncConnection):
     """Asynchronous UDP Connection class"""
 
-    __slots__ = ("_addr", "stream", "timeout")
+    __slots__ = ("_addr", "socket", "timeout")
 
     def __init__(self, addr: Address, timeout: float = 3) -> None:
         # This will only be None until connect is called, ignore the None type assignment
-        self.stream: asyncio_dgram.aio.DatagramClient = None  # type: ignore[assignment]
+        self.socket: socket.socket = None  # type: ignore[assignment]
         self.timeout: float = timeout
         self._addr = addr
 
     async def connect(self) -> None:
-        """Connect to address. Timeout is in seconds."""
-        conn = asyncio_dgram.connect(self._addr)
-        self.stream = await asyncio.wait_for(conn, timeout=self.timeout)
+        """Create a non-blocking UDP socket connected to address. Timeout is in seconds.
+
+        The socket is driven directly through the event loop's ``sock_*`` methods,
+        which avoids the overhead of a transport/protocol pair for these short exchanges.
+        """
+        loop = asyncio.get_running_loop()
+        host, port = self._addr
+        version = ip_type(host)
+        if version is None:
+            # Hostnames have to be resolved first, the result also tells us which address family to use
+            infos = await asyncio.wait_for(loop.getaddrinfo(host, port, type=socket.SOCK_DGRAM), timeout=self.timeout)
+            family, _, _, _, sock_addr = infos[0]
+        else:
+            family = socket.AF_INET if version == 4 else socket.AF_INET6
+            sock_addr = (host, port)
+
+        self.socket = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            self.socket.setblocking(False)
+            await asyncio.wait_for(loop.sock_connect(self.socket, sock_addr), timeout=self.timeout)
+        except BaseException:
+            # Nobody will close a connection which failed to connect, so the socket would leak otherwise
+            self.socket.close()
+            raise
 
     def remaining(self) -> int:
         """Always return ``65535`` (``2 ** 16 - 1``)."""
         return 65535
 
     async def read(self, length: int) -> bytearray:
-        """Read from :attr:`.stream`. Length does nothing here."""
-        data, remote_addr = await asyncio.wait_for(self.stream.recv(), timeout=self.timeout)
+        """Read from :attr:`.socket`. Length does nothing here."""
+        loop = asyncio.get_running_loop()
+        data = await asyncio.wait_for(loop.sock_recv(self.socket, self.remaining()), timeout=self.timeout)
         return bytearray(data)
 
     async def write(self, data: Connection | str | bytes | bytearray) -> None:
-        """Send data with :attr:`.stream`."""
+        """Send data with :attr:`.socket`."""
         if isinstance(data, Connection):
             data = bytearray(data.flush())
         elif isinstance(data, str):
             data = bytearray(data, "utf-8")
-        await self.stream.send(data)
+        await asyncio.get_running_loop().sock_sendall(self.socket, data)
 
     def close(self) -> None:
-        """Close :attr:`.stream`."""
-        if self.stream is not None:  # If initialized
-            self.stream.close()
+        """Close :attr:`.socket`."""
+        if self.socket is not None:  # If initialized
+            self.socket.close()
 
     async def __aenter__(self) -> Self:
         await self.connect()
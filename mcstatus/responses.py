@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
@@ -68,8 +69,12 @@ __all__ = [
     "JavaStatusVersion",
 ]
 
+# Responses are often kept around in bulk (e.g. when scanning many servers), slots make the instances
+# considerably smaller, though dataclasses can only generate them on Python 3.10+
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class BaseStatusResponse(ABC):
     """Class for storing shared data from a status response."""
 
@@ -102,7 +107,7 @@ class BaseStatusResponse(ABC):
         raise NotImplementedError("You can't use abstract methods.")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class JavaStatusResponse(BaseStatusResponse):
     """The response object for :meth:`JavaServer.status() <mcstatus.server.JavaServer.status>`."""
 
@@ -160,7 +165,7 @@ class JavaStatusResponse(BaseStatusResponse):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BedrockStatusResponse(BaseStatusResponse):
     """The response object for :meth:`BedrockServer.status() <mcstatus.server.BedrockServer.status>`."""
 
@@ -180,14 +185,9 @@ class BedrockStatusResponse(BaseStatusResponse):
         :return: :class:`BedrockStatusResponse` object.
         """
 
-        try:
-            map_name = decoded_data[7]
-        except IndexError:
-            map_name = None
-        try:
-            gamemode = decoded_data[8]
-        except IndexError:
-            gamemode = None
+        # Older servers don't send the map name and gamemode
+        map_name = decoded_data[7] if len(decoded_data) > 7 else None
+        gamemode = decoded_data[8] if len(decoded_data) > 8 else None
 
         return cls(
             players=BedrockStatusPlayers(
@@ -206,7 +206,7 @@ class BedrockStatusResponse(BaseStatusResponse):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BaseStatusPlayers(ABC):
     """Class for storing information about players on the server."""
 
@@ -216,7 +216,7 @@ class BaseStatusPlayers(ABC):
     """The maximum allowed number of players (aka server slots)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class JavaStatusPlayers(BaseStatusPlayers):
     """Class for storing information about players on the server."""
 
@@ -253,12 +253,12 @@ class JavaStatusPlayers(BaseStatusPlayers):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BedrockStatusPlayers(BaseStatusPlayers):
     """Class for storing information about players on the server."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class JavaStatusPlayer:
     """Class with information about a single player."""
 
@@ -285,7 +285,7 @@ class JavaStatusPlayer:
         return cls(name=raw["name"], id=raw["id"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BaseStatusVersion(ABC):
     """A class for storing version information."""
 
@@ -302,7 +302,7 @@ class BaseStatusVersion(ABC):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class JavaStatusVersion(BaseStatusVersion):
     """A class for storing version information."""
 
@@ -319,7 +319,7 @@ class JavaStatusVersion(BaseStatusVersion):
         return cls(name=raw["name"], protocol=raw["protocol"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BedrockStatusVersion(BaseStatusVersion):
     """A class for storing version information."""
 
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import ipaddress
+import threading
+import time
 from abc import ABC
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TYPE_CHECKING, TypeVar
 
-from mcstatus.address import Address, async_minecraft_srv_address_lookup, minecraft_srv_address_lookup
+from mcstatus.address import Address, _async_minecraft_srv_address_lookup, _minecraft_srv_address_lookup
 from mcstatus.bedrock_status import BedrockServerStatus
-from mcstatus.pinger import AsyncServerPinger, ServerPinger
+from mcstatus.pinger import AsyncServerPinger, ServerPinger, generate_ping_token
 from mcstatus.protocol.connection import (
     TCPAsyncSocketConnection,
     TCPSocketConnection,
@@ -14,14 +21,131 @@ from mcstatus.protocol.connection import (
 )
 from mcstatus.querier import AsyncServerQuerier, QueryResponse, ServerQuerier
 from mcstatus.responses import BedrockStatusResponse, JavaStatusResponse
-from mcstatus.utils import retry
+from mcstatus.utils import SingleFlight, async_retry_call, retry_call
 
 if TYPE_CHECKING:
+    import dns.asyncresolver
+    import dns.resolver
     from typing_extensions import Self
 
 
 __all__ = ["BedrockServer", "JavaServer", "MCServer"]
 
+T = TypeVar("T")
+
+# Exceptions which the connection classes, pingers and queriers raise when an exchange fails,
+# anything else (e.g. a malformed response which passed the transport checks) is not worth retrying.
+# (On Python < 3.11, asyncio.TimeoutError is not a subclass of OSError.)
+_RETRY_EXCEPTIONS = (OSError, asyncio.TimeoutError)
+# The query protocol also parses the challenge token and the response fields, which raises ValueError
+_QUERY_RETRY_EXCEPTIONS = (*_RETRY_EXCEPTIONS, ValueError)
+# Nothing listens on the port, trying again won't change that
+_ABORT_EXCEPTIONS = (ConnectionRefusedError,)
+
+# How many seconds an address looked up by JavaServer.lookup is reused for, before its SRV record is queried again
+_SRV_CACHE_TTL = 300.0
+# How many looked up addresses are kept at most, the least recently used ones are dropped first
+_SRV_CACHE_SIZE = 1024
+# Looked up addresses, by the (address, default port) they were looked up for, along with the time they expire at
+_SRV_CACHE: OrderedDict[tuple[str, int], tuple[float, Address]] = OrderedDict()
+# The lookups can run from multiple threads (e.g. status_many), the cache is only ever touched with this lock held
+_SRV_CACHE_LOCK = threading.Lock()
+
+# Concurrent async status requests to the same server share a single exchange, instead of each making their own
+_java_status_requests: SingleFlight[JavaStatusResponse] = SingleFlight()
+_bedrock_status_requests: SingleFlight[BedrockStatusResponse] = SingleFlight()
+
+
+# Resolvers shared by all of the lookups, with a cache of the DNS answers (kept for as long as their TTL allows),
+# they're only created on first use, as that reads the system's resolver configuration
+_resolver: dns.resolver.Resolver | None = None
+_async_resolver: dns.asyncresolver.Resolver | None = None
+# Default of the JavaServer.set_resolver arguments, telling apart an omitted argument from an explicit None
+_NOT_GIVEN: Any = object()
+
+
+def _get_resolver() -> dns.resolver.Resolver:
+    """Get the shared resolver used for the DNS lookups, creating it on first use."""
+    global _resolver
+    if _resolver is None:
+        import dns.resolver
+
+        _resolver = dns.resolver.Resolver()
+        _resolver.cache = dns.resolver.LRUCache(1000)
+    return _resolver
+
+
+def _get_async_resolver() -> dns.asyncresolver.Resolver:
+    """Get the shared asynchronous resolver used for the DNS lookups, creating it on first use."""
+    global _async_resolver
+    if _async_resolver is None:
+        import dns.asyncresolver
+        import dns.resolver
+
+        _async_resolver = dns.asyncresolver.Resolver()
+        _async_resolver.cache = dns.resolver.LRUCache(1000)
+    return _async_resolver
+
+
+def _get_cached_lookup(key: tuple[str, int]) -> Address | None:
+    """Get the cached result of an SRV lookup, or ``None`` if it isn't cached (or it already expired)."""
+    with _SRV_CACHE_LOCK:
+        cached = _SRV_CACHE.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() >= cached[0]:
+            del _SRV_CACHE[key]
+            return None
+        _SRV_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def _cache_lookup(key: tuple[str, int], address: Address) -> None:
+    """Store the result of an SRV lookup, for it to be reused by the following lookups."""
+    with _SRV_CACHE_LOCK:
+        _SRV_CACHE[key] = (time.monotonic() + _SRV_CACHE_TTL, address)
+        _SRV_CACHE.move_to_end(key)
+        if len(_SRV_CACHE) > _SRV_CACHE_SIZE:
+            _SRV_CACHE.popitem(last=False)
+
+
+async def _run_many(
+    addresses: Iterable[str],
+    request: Callable[[str], Awaitable[T]],
+    concurrency: int,
+) -> list[tuple[str, T | Exception]]:
+    """Run ``request`` for each of the addresses concurrently, with at most ``concurrency`` of them running at once.
+
+    Failures don't stop the other requests, the raised exception is returned in place of the result instead.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(address: str) -> tuple[str, T | Exception]:
+        async with semaphore:
+            try:
+                return address, await request(address)
+            except Exception as exc:
+                return address, exc
+
+    return await asyncio.gather(*(run_one(address) for address in addresses))
+
+
+def _run_many_in_threads(
+    addresses: Iterable[str],
+    request: Callable[[str], T],
+    concurrency: int,
+) -> list[tuple[str, T | Exception]]:
+    """Synchronous alternative to :func:`_run_many`, running the requests in a pool of ``concurrency`` threads."""
+
+    def run_one(address: str) -> tuple[str, T | Exception]:
+        try:
+            return address, request(address)
+        except Exception as exc:
+            return address, exc
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(run_one, addresses))
+
 
 class MCServer(ABC):
     """Base abstract class for a general minecraft server.
@@ -30,6 +154,8 @@ class MCServer(ABC):
     it doesn't include any version specific settings and it can't be used to make any requests.
     """
 
+    __slots__ = ("address", "timeout")
+
     DEFAULT_PORT: int
 
     def __init__(self, host: str, port: int | None = None, timeout: float = 3):
@@ -53,14 +179,49 @@ class MCServer(ABC):
         addr = Address.parse_address(address, default_port=cls.DEFAULT_PORT)
         return cls(addr.host, addr.port, timeout=timeout)
 
+    @classmethod
+    def from_resolved(cls, ip: str, port: int | None = None, *, timeout: float = 3) -> Self:
+        """Construct the server from an already resolved IP address, skipping any DNS resolution.
+
+        This is useful if you resolve the addresses yourself (or have them cached somewhere),
+        the server constructed this way won't ever perform a DNS query.
+
+        :param ip: The IP address (v4 or v6) of the minecraft server.
+        :param port: The port that the server is on.
+        :param timeout: The timeout in seconds before failing to connect.
+        :raises ValueError: The given ``ip`` isn't a valid IP address (e.g. it's a hostname).
+        """
+        ip_addr = ipaddress.ip_address(ip)
+        server = cls(ip, port, timeout=timeout)
+        # An IP literal will never resolve to anything else, so the address can just use it directly
+        server.address._cached_ip = ip_addr
+        server.address._cached_ip_expiry = float("inf")
+        return server
+
 
 class JavaServer(MCServer):
     """Base class for a Minecraft Java Edition server."""
 
+    __slots__ = ("_resolved_address_cache", "connect_timeout")
+
     DEFAULT_PORT = 25565
 
+    def __init__(self, host: str, port: int | None = None, timeout: float = 3, *, connect_timeout: float | None = None):
+        """
+        :param host: The host/ip of the minecraft server.
+        :param port: The port that the server is on.
+        :param timeout: The timeout in seconds before failing to connect, or to receive a response.
+        :param connect_timeout:
+            The timeout in seconds before failing to connect, if it should differ from ``timeout``. A short
+            connect timeout makes offline servers fail fast, without cutting off slow responses of online ones.
+        """
+        super().__init__(host, port, timeout)
+        self.connect_timeout = timeout if connect_timeout is None else connect_timeout
+        # The last resolved IP and the address made from it, so polling doesn't create a new address every time
+        self._resolved_address_cache: tuple[str, Address] | None = None
+
     @classmethod
-    def lookup(cls, address: str, timeout: float = 3) -> Self:
+    def lookup(cls, address: str, timeout: float = 3, *, resolve_srv: bool = True) -> Self:
         """Mimics minecraft's server address field.
 
         With Java servers, on top of just parsing the address, we also check the
@@ -68,87 +229,276 @@ class JavaServer(MCServer):
         behavior as with minecraft's server address field for Java. This DNS record
         resolution is happening synchronously (see :meth:`.async_lookup`).
 
+        The looked up address is cached for 5 minutes, so looking up the same address
+        again won't repeat the DNS query every time, see :meth:`.clear_lookup_cache`.
+
         :param address: The address of the Minecraft server, like ``example.com:25565``.
         :param timeout: The timeout in seconds before failing to connect.
+        :param resolve_srv:
+            Whether to look for an SRV record when the address doesn't include a port. Disabling this
+            makes the lookup purely parse the address (using the default port), which is useful when
+            scanning many addresses that are known not to use SRV records.
         """
-        addr = minecraft_srv_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout)
-        return cls(addr.host, addr.port, timeout=timeout)
+        if not resolve_srv:
+            return super().lookup(address, timeout)
+
+        key = (address, cls.DEFAULT_PORT)
+        addr = _get_cached_lookup(key)
+        if addr is None:
+            # Called directly, so that the warning about blocking a running event loop points at the caller
+            addr = _minecraft_srv_address_lookup(
+                address,
+                default_port=cls.DEFAULT_PORT,
+                lifetime=timeout,
+                get_resolver=_get_resolver,
+            )
+            _cache_lookup(key, addr)
+        return cls._from_looked_up(addr, timeout)
 
     @classmethod
-    async def async_lookup(cls, address: str, timeout: float = 3) -> Self:
+    async def async_lookup(cls, address: str, timeout: float = 3, *, resolve_srv: bool = True) -> Self:
         """Asynchronous alternative to :meth:`.lookup`.
 
         For more details, check the :meth:`JavaServer.lookup() <.lookup>` docstring.
         """
-        addr = await async_minecraft_srv_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout)
-        return cls(addr.host, addr.port, timeout=timeout)
+        if not resolve_srv:
+            return super().lookup(address, timeout)
+
+        key = (address, cls.DEFAULT_PORT)
+        addr = _get_cached_lookup(key)
+        if addr is None:
+            addr = await _async_minecraft_srv_address_lookup(
+                address,
+                default_port=cls.DEFAULT_PORT,
+                lifetime=timeout,
+                get_resolver=_get_async_resolver,
+            )
+            _cache_lookup(key, addr)
+        return cls._from_looked_up(addr, timeout)
 
-    def ping(self, **kwargs) -> float:
-        """Checks the latency between a Minecraft Java Edition server and the client (you).
+    @classmethod
+    def _from_looked_up(cls, address: Address, timeout: float) -> Self:
+        """Construct the server from a looked up address, keeping any IP which was already resolved along the way."""
+        server = cls(address.host, address.port, timeout=timeout)
+        server.address = address
+        return server
+
+    @staticmethod
+    def clear_lookup_cache() -> None:
+        """Forget all of the addresses cached by :meth:`.lookup` and :meth:`.async_lookup`."""
+        with _SRV_CACHE_LOCK:
+            _SRV_CACHE.clear()
+
+    @staticmethod
+    def set_resolver(
+        resolver: dns.resolver.Resolver | None = _NOT_GIVEN,
+        async_resolver: dns.asyncresolver.Resolver | None = _NOT_GIVEN,
+    ) -> None:
+        """Set the resolvers used for the DNS lookups of :meth:`.lookup`, :meth:`.query` and their async alternatives.
+
+        By default, the resolvers are configured from the system's configuration, with a cache of the answers.
+        Passing ``None`` will reset the given resolver back to that default one, an omitted argument leaves
+        its resolver as it is.
+
+        :param resolver: The resolver used by :meth:`.lookup` and :meth:`.query`.
+        :param async_resolver: The resolver used by :meth:`.async_lookup` and :meth:`.async_query`.
+        """
+        global _resolver, _async_resolver
+        if resolver is not _NOT_GIVEN:
+            _resolver = resolver
+        if async_resolver is not _NOT_GIVEN:
+            _async_resolver = async_resolver
 
-        :param kwargs: Passed to a :class:`~mcstatus.pinger.ServerPinger` instance.
-        :return: The latency between the Minecraft Server and you.
+    @classmethod
+    def status_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 16,
+        timeout: float = 3,
+    ) -> list[tuple[str, JavaStatusResponse | Exception]]:
+        """Look up and check the status of many servers concurrently, using a pool of threads.
+
+        Every server is handled in a thread of its own, so ``concurrency`` is the amount of threads used.
+        When checking a lot of servers, prefer :meth:`.async_status_many`, which doesn't need any threads.
+        For more details, check its docstring.
         """
 
-        with TCPSocketConnection(self.address, self.timeout) as connection:
-            return self._retry_ping(connection, **kwargs)
+        def status_one(address: str) -> JavaStatusResponse:
+            return cls.lookup(address, timeout=timeout).status()
 
-    @retry(tries=3)
-    def _retry_ping(self, connection: TCPSocketConnection, **kwargs) -> float:
-        pinger = ServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
-        return pinger.test_ping()
+        return _run_many_in_threads(addresses, status_one, concurrency)
 
-    async def async_ping(self, **kwargs) -> float:
-        """Asynchronously checks the latency between a Minecraft Java Edition server and the client (you).
+    @classmethod
+    async def async_status_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 64,
+        timeout: float = 3,
+    ) -> list[tuple[str, JavaStatusResponse | Exception]]:
+        """Look up and check the status of many servers concurrently.
+
+        At most ``concurrency`` servers are being looked up and pinged at any given moment,
+        the rest wait for a free slot. Failures don't stop the other requests, instead, the
+        raised exception is returned in place of the status for that address.
+
+        .. note::
+            Every request in flight holds its own socket (and so an ephemeral port), keep
+            ``concurrency`` well below the amount of ports (and file descriptors) available
+            to your process.
+
+        :param addresses: The addresses of the servers, like ``example.com:25565``, see :meth:`.lookup`.
+        :param concurrency: Maximum amount of servers handled at once.
+        :param timeout: The timeout in seconds before failing to connect, used for each server.
+        :return:
+            A list of ``(address, result)`` tuples, in the same order as ``addresses``, where result
+            is either a :class:`~mcstatus.responses.JavaStatusResponse`, or the exception that was raised.
+        """
+
+        async def status_one(address: str) -> JavaStatusResponse:
+            server = await cls.async_lookup(address, timeout=timeout)
+            return await server.async_status()
+
+        return await _run_many(addresses, status_one, concurrency)
+
+    @classmethod
+    async def async_ping_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 64,
+        timeout: float = 3,
+    ) -> list[tuple[str, float | Exception]]:
+        """Look up and ping many servers concurrently.
+
+        Returns a list of ``(address, latency)`` tuples, for more details,
+        check the :meth:`.async_status_many` docstring.
+        """
 
-        :param kwargs: Passed to a :class:`~mcstatus.pinger.AsyncServerPinger` instance.
+        async def ping_one(address: str) -> float:
+            server = await cls.async_lookup(address, timeout=timeout)
+            return await server.async_ping()
+
+        return await _run_many(addresses, ping_one, concurrency)
+
+    @classmethod
+    async def async_query_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 64,
+        timeout: float = 3,
+    ) -> list[tuple[str, QueryResponse | Exception]]:
+        """Look up and query many servers concurrently.
+
+        Returns a list of ``(address, query response)`` tuples, for more details,
+        check the :meth:`.async_status_many` docstring.
+        """
+
+        async def query_one(address: str) -> QueryResponse:
+            server = await cls.async_lookup(address, timeout=timeout)
+            return await server.async_query()
+
+        return await _run_many(addresses, query_one, concurrency)
+
+    def _get_resolved_address(self, ip: str) -> Address:
+        """Get the address with given resolved IP, reusing the previous one if the IP didn't change."""
+        if self._resolved_address_cache is None or self._resolved_address_cache[0] != ip:
+            self._resolved_address_cache = (ip, Address(ip, self.address.port))
+        return self._resolved_address_cache[1]
+
+    def _get_connect_address(self) -> Address:
+        """Get the address to connect to, which is the resolved IP if it's cached already, saving another DNS lookup."""
+        ip = self.address._get_cached_ip()
+        if ip is None:
+            return self.address
+        return self._get_resolved_address(str(ip))
+
+    def ping(self, *, tries: int = 3, version: int = 47, ping_token: int | None = None) -> float:
+        """Checks the latency between a Minecraft Java Edition server and the client (you).
+
+        :param tries: The number of times to retry if an error is encountered.
+        :param version: Version of the client, see `Protocol version numbers <https://wiki.vg/Protocol_version_numbers>`_.
+        :param ping_token: Token sent in the ping request, which the server has to send back. Random by default.
         :return: The latency between the Minecraft Server and you.
         """
+        token = generate_ping_token() if ping_token is None else ping_token
+        return retry_call(lambda: self._ping_once(version, token), tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS)
 
-        async with TCPAsyncSocketConnection(self.address, self.timeout) as connection:
-            return await self._retry_async_ping(connection, **kwargs)
+    def _ping_once(self, version: int, ping_token: int) -> float:
+        # Each try gets a fresh connection, a failed exchange can leave unread data in the old one
+        with TCPSocketConnection(self._get_connect_address(), self.timeout, self.connect_timeout) as connection:
+            pinger = ServerPinger(connection, address=self.address, version=version, ping_token=ping_token)
+            pinger.handshake()
+            return pinger.test_ping()
 
-    @retry(tries=3)
-    async def _retry_async_ping(self, connection: TCPAsyncSocketConnection, **kwargs) -> float:
-        pinger = AsyncServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
-        ping = await pinger.test_ping()
-        return ping
+    async def async_ping(self, *, tries: int = 3, version: int = 47, ping_token: int | None = None) -> float:
+        """Asynchronously checks the latency between a Minecraft Java Edition server and the client (you).
 
-    def status(self, **kwargs) -> JavaStatusResponse:
+        :param tries: The number of times to retry if an error is encountered.
+        :param version: Version of the client, see `Protocol version numbers <https://wiki.vg/Protocol_version_numbers>`_.
+        :param ping_token: Token sent in the ping request, which the server has to send back. Random by default.
+        :return: The latency between the Minecraft Server and you.
+        """
+        token = generate_ping_token() if ping_token is None else ping_token
+        return await async_retry_call(
+            lambda: self._async_ping_once(version, token), tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS
+        )
+
+    async def _async_ping_once(self, version: int, ping_token: int) -> float:
+        # Each try gets a fresh connection, a failed exchange can leave unread data in the old one
+        async with TCPAsyncSocketConnection(self._get_connect_address(), self.timeout, self.connect_timeout) as connection:
+            pinger = AsyncServerPinger(connection, address=self.address, version=version, ping_token=ping_token)
+            pinger.handshake()
+            return await pinger.test_ping()
+
+    def status(self, *, tries: int = 3, version: int = 47) -> JavaStatusResponse:
         """Checks the status of a Minecraft Java Edition server via the status protocol.
 
-        :param kwargs: Passed to a :class:`~mcstatus.pinger.ServerPinger` instance.
+        :param tries: The number of times to retry if an error is encountered.
+        :param version: Version of the client, see `Protocol version numbers <https://wiki.vg/Protocol_version_numbers>`_.
         :return: Status information in a :class:`~mcstatus.responses.JavaStatusResponse` instance.
         """
+        return retry_call(lambda: self._status_once(version), tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS)
 
-        with TCPSocketConnection(self.address, self.timeout) as connection:
-            return self._retry_status(connection, **kwargs)
-
-    @retry(tries=3)
-    def _retry_status(self, connection: TCPSocketConnection, **kwargs) -> JavaStatusResponse:
-        pinger = ServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
-        result = pinger.read_status()
-        return result
+    def _status_once(self, version: int) -> JavaStatusResponse:
+        # Each try gets a fresh connection, a failed exchange can leave unread data in the old one
+        with TCPSocketConnection(self._get_connect_address(), self.timeout, self.connect_timeout) as connection:
+            pinger = ServerPinger(connection, address=self.address, version=version)
+            pinger.handshake_and_request_status()
+            return pinger.read_status_response()
 
-    async def async_status(self, **kwargs) -> JavaStatusResponse:
+    async def async_status(self, *, tries: int = 3, version: int = 47, coalesce: bool = False) -> JavaStatusResponse:
         """Asynchronously checks the status of a Minecraft Java Edition server via the status protocol.
 
-        :param kwargs: Passed to a :class:`~mcstatus.pinger.AsyncServerPinger` instance.
+        :param tries: The number of times to retry if an error is encountered.
+        :param version: Version of the client, see `Protocol version numbers <https://wiki.vg/Protocol_version_numbers>`_.
+        :param coalesce:
+            Whether to share the request with any other concurrent coalesced ``async_status`` calls for the same
+            server, made with the same ``tries``, ``version`` and timeouts, all of them then get the same response.
+            Cancelling one of these calls doesn't cancel the request for the others. Leave this disabled if every
+            call has to make its own request, for example when measuring the latency.
         :return: Status information in a :class:`~mcstatus.responses.JavaStatusResponse` instance.
         """
-
-        async with TCPAsyncSocketConnection(self.address, self.timeout) as connection:
-            return await self._retry_async_status(connection, **kwargs)
-
-    @retry(tries=3)
-    async def _retry_async_status(self, connection: TCPAsyncSocketConnection, **kwargs) -> JavaStatusResponse:
-        pinger = AsyncServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
-        result = await pinger.read_status()
-        return result
+        if not coalesce:
+            return await self._async_status(tries, version)
+        return await _java_status_requests.do(
+            (self.address.host, self.address.port, tries, version, self.timeout, self.connect_timeout),
+            lambda: self._async_status(tries, version),
+        )
+
+    async def _async_status(self, tries: int, version: int) -> JavaStatusResponse:
+        return await async_retry_call(
+            lambda: self._async_status_once(version), tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS
+        )
+
+    async def _async_status_once(self, version: int) -> JavaStatusResponse:
+        # Each try gets a fresh connection, a failed exchange can leave unread data in the old one
+        async with TCPAsyncSocketConnection(self._get_connect_address(), self.timeout, self.connect_timeout) as connection:
+            pinger = AsyncServerPinger(connection, address=self.address, version=version)
+            pinger.handshake_and_request_status()
+            return await pinger.read_status_response()
 
     def query(self, *, tries: int = 3) -> QueryResponse:
         """Checks the status of a Minecraft Java Edition server via the query protocol.
@@ -156,11 +506,16 @@ class JavaServer(MCServer):
         :param tries: The number of times to retry if an error is encountered.
         :return: Query information in a :class:`~mcstatus.querier.QueryResponse` instance.
         """
-        ip = str(self.address.resolve_ip())
-        return self._retry_query(Address(ip, self.address.port), tries=tries)
-
-    @retry(tries=3)
-    def _retry_query(self, addr: Address, **_kwargs) -> QueryResponse:
+        try:
+            # Skip resolving altogether if the host is already an IP
+            ipaddress.ip_address(self.address.host)
+        except ValueError:
+            addr = self._get_resolved_address(str(self.address._resolve_ip(None, _get_resolver)))
+        else:
+            addr = self.address
+        return retry_call(lambda: self._query_once(addr), tries, _QUERY_RETRY_EXCEPTIONS)
+
+    def _query_once(self, addr: Address) -> QueryResponse:
         with UDPSocketConnection(addr, self.timeout) as connection:
             querier = ServerQuerier(connection)
             querier.handshake()
@@ -172,36 +527,138 @@ class JavaServer(MCServer):
         :param tries: The number of times to retry if an error is encountered.
         :return: Query information in a :class:`~mcstatus.querier.QueryResponse` instance.
         """
-        ip = str(await self.address.async_resolve_ip())
-        return await self._retry_async_query(Address(ip, self.address.port), tries=tries)
-
-    @retry(tries=3)
-    async def _retry_async_query(self, address: Address, **_kwargs) -> QueryResponse:
-        async with UDPAsyncSocketConnection(address, self.timeout) as connection:
+        try:
+            # Skip resolving altogether if the host is already an IP
+            ipaddress.ip_address(self.address.host)
+        except ValueError:
+            addr = self._get_resolved_address(str(await self.address._async_resolve_ip(None, _get_async_resolver)))
+        else:
+            addr = self.address
+        return await async_retry_call(lambda: self._async_query_once(addr), tries, _QUERY_RETRY_EXCEPTIONS)
+
+    async def _async_query_once(self, addr: Address) -> QueryResponse:
+        async with UDPAsyncSocketConnection(addr, self.timeout) as connection:
             querier = AsyncServerQuerier(connection)
             await querier.handshake()
             return await querier.read_query()
 
+    def full_info(
+        self,
+        *,
+        tries: int = 3,
+        version: int = 47,
+    ) -> tuple[JavaStatusResponse | BaseException, QueryResponse | BaseException]:
+        """Checks the server via both the status and the query protocol at once.
+
+        The status and the query requests are sent in parallel (from two threads), so this
+        only takes as long as the slower one of them, rather than as long as both together.
+        A failure of one of them doesn't affect the other one, instead, the raised exception
+        is returned in place of its response.
+
+        :param tries: The number of times to retry if an error is encountered, for each of the requests.
+        :param version: Version of the client, see `Protocol version numbers <https://wiki.vg/Protocol_version_numbers>`_.
+        :return:
+            A tuple of the status (:class:`~mcstatus.responses.JavaStatusResponse`) and the query
+            (:class:`~mcstatus.querier.QueryResponse`) response, or the exceptions raised instead.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status = executor.submit(self.status, tries=tries, version=version)
+            query = executor.submit(self.query, tries=tries)
+
+        status_exc = status.exception()
+        query_exc = query.exception()
+        return (
+            status.result() if status_exc is None else status_exc,
+            query.result() if query_exc is None else query_exc,
+        )
+
+    async def async_full_info(
+        self,
+        *,
+        tries: int = 3,
+        version: int = 47,
+    ) -> tuple[JavaStatusResponse | BaseException, QueryResponse | BaseException]:
+        """Asynchronously checks the server via both the status and the query protocol at once.
+
+        For more details, check the :meth:`.full_info` docstring.
+        """
+        status, query = await asyncio.gather(
+            self.async_status(tries=tries, version=version),
+            self.async_query(tries=tries),
+            return_exceptions=True,
+        )
+        return status, query
+
 
 class BedrockServer(MCServer):
     """Base class for a Minecraft Bedrock Edition server."""
 
+    __slots__ = ()
+
     DEFAULT_PORT = 19132
 
-    @retry(tries=3)
-    def status(self, **kwargs) -> BedrockStatusResponse:
+    @classmethod
+    def status_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 16,
+        timeout: float = 3,
+    ) -> list[tuple[str, BedrockStatusResponse | Exception]]:
+        """Check the status of many servers concurrently, using a pool of threads.
+
+        For more details, check the :meth:`JavaServer.status_many() <.JavaServer.status_many>` docstring.
+        """
+
+        def status_one(address: str) -> BedrockStatusResponse:
+            return cls.lookup(address, timeout=timeout).status()
+
+        return _run_many_in_threads(addresses, status_one, concurrency)
+
+    @classmethod
+    async def async_status_many(
+        cls,
+        addresses: Iterable[str],
+        *,
+        concurrency: int = 64,
+        timeout: float = 3,
+    ) -> list[tuple[str, BedrockStatusResponse | Exception]]:
+        """Check the status of many servers concurrently.
+
+        For more details, check the :meth:`JavaServer.async_status_many() <.JavaServer.async_status_many>` docstring.
+        """
+
+        async def status_one(address: str) -> BedrockStatusResponse:
+            return await cls.lookup(address, timeout=timeout).async_status()
+
+        return await _run_many(addresses, status_one, concurrency)
+
+    def status(self, *, tries: int = 3) -> BedrockStatusResponse:
         """Checks the status of a Minecraft Bedrock Edition server.
 
-        :param kwargs: Passed to a :class:`~mcstatus.bedrock_status.BedrockServerStatus` instance.
+        :param tries: The number of times to retry if an error is encountered.
         :return: Status information in a :class:`~mcstatus.responses.BedrockStatusResponse` instance.
         """
-        return BedrockServerStatus(self.address, self.timeout, **kwargs).read_status()
+        # The protocol is connectionless, so the retries can just resend the request from the same socket
+        with BedrockServerStatus(self.address, self.timeout) as status:
+            return retry_call(status.read_status, tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS)
 
-    @retry(tries=3)
-    async def async_status(self, **kwargs) -> BedrockStatusResponse:
+    async def async_status(self, *, tries: int = 3, coalesce: bool = False) -> BedrockStatusResponse:
         """Asynchronously checks the status of a Minecraft Bedrock Edition server.
 
-        :param kwargs: Passed to a :class:`~mcstatus.bedrock_status.BedrockServerStatus` instance.
+        :param tries: The number of times to retry if an error is encountered.
+        :param coalesce:
+            Whether to share the request with any other concurrent coalesced ``async_status`` calls for the same
+            server, made with the same ``tries`` and timeout, see :meth:`JavaServer.async_status()
+            <.JavaServer.async_status>`.
         :return: Status information in a :class:`~mcstatus.responses.BedrockStatusResponse` instance.
         """
-        return await BedrockServerStatus(self.address, self.timeout, **kwargs).read_status_async()
+        if not coalesce:
+            return await self._async_status(tries)
+        return await _bedrock_status_requests.do(
+            (self.address.host, self.address.port, tries, self.timeout), lambda: self._async_status(tries)
+        )
+
+    async def _async_status(self, tries: int) -> BedrockStatusResponse:
+        async with BedrockServerStatus(self.address, self.timeout) as status:
+            return await async_retry_call(status.read_status_async, tries, _RETRY_EXCEPTIONS, abort_on=_ABORT_EXCEPTIONS)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import random
+import time
 import warnings
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Hashable, Iterable
 from functools import wraps
-from typing import Any, TYPE_CHECKING, TypeVar, cast, overload
+from typing import Any, Generic, TYPE_CHECKING, TypeVar, cast, overload
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec, Protocol
@@ -21,15 +23,90 @@ R = TypeVar("R")
 R2 = TypeVar("R2")
 
 
-def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) -> Callable[[Callable[P, R]], Callable[P, R]]:
+def retry_backoff(attempt: int, base_delay: float = 0.05, max_delay: float = 1.0, jitter: float = 0.5) -> float:
+    """Compute how many seconds to wait before retrying, after the ``attempt``-th try (counted from 0) failed.
+
+    The delay grows exponentially from ``base_delay`` up to ``max_delay``, and is then randomly scaled
+    by up to ``jitter`` (a fraction of the delay) in either direction, so that many clients which failed
+    at the same moment don't all retry in lockstep.
+    """
+    return min(max_delay, base_delay * 2**attempt) * (1 + random.uniform(-jitter, jitter))
+
+
+def retry_call(
+    func: Callable[[], R],
+    tries: int,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+    *,
+    abort_on: tuple[type[BaseException], ...] = (),
+    base_delay: float = 0.05,
+    max_delay: float = 1.0,
+    jitter: float = 0.5,
+) -> R:
+    """Call given function up to ``tries`` times, until it doesn't raise one of the ``exceptions``.
+
+    Between the tries, wait for an exponentially growing, randomized delay, see :func:`retry_backoff`
+    for the meaning of ``base_delay``, ``max_delay`` and ``jitter``. Exceptions from ``abort_on`` are
+    raised right away, without any further tries, even if they're also a part of ``exceptions``.
+
+    If the function fails even after all the tries, raise the last exception that the function raised.
+    """
+    last_exc: BaseException
+    for attempt in range(tries):
+        if attempt:
+            time.sleep(retry_backoff(attempt - 1, base_delay, max_delay, jitter))
+        try:
+            return func()
+        except abort_on:
+            raise
+        except exceptions as exc:
+            last_exc = exc
+    else:
+        raise last_exc  # type: ignore # (This won't actually be unbound)
+
+
+async def async_retry_call(
+    func: Callable[[], Awaitable[R]],
+    tries: int,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+    *,
+    abort_on: tuple[type[BaseException], ...] = (),
+    base_delay: float = 0.05,
+    max_delay: float = 1.0,
+    jitter: float = 0.5,
+) -> R:
+    """Asynchronous alternative to :func:`retry_call`, awaiting the result of each call of ``func``."""
+    last_exc: BaseException
+    for attempt in range(tries):
+        if attempt:
+            await asyncio.sleep(retry_backoff(attempt - 1, base_delay, max_delay, jitter))
+        try:
+            return await func()
+        except abort_on:
+            raise
+        except exceptions as exc:
+            last_exc = exc
+    else:
+        raise last_exc  # type: ignore # (This won't actually be unbound)
+
+
+def retry(
+    tries: int,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+    *,
+    abort_on: tuple[type[BaseException], ...] = (),
+    base_delay: float = 0.05,
+    max_delay: float = 1.0,
+    jitter: float = 0.5,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator that re-runs given function ``tries`` times if error occurs.
 
     The amount of tries will either be the value given to the decorator,
     or if tries is present in keyword arguments on function call, this
     specified value will take precedence.
 
-    If the function fails even after all the retries, raise the last
-    exception that the function raised.
+    The tries are made with :func:`retry_call` (or :func:`async_retry_call` for async
+    functions), see it for the meaning of the other arguments.
 
     .. note::
         Even if the previous failures caused a different exception, this will only raise the last one.
@@ -42,14 +119,15 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
             tries: int = tries,  # type: ignore # (No support for adding kw-only args)
             **kwargs: P.kwargs,
         ) -> R:
-            last_exc: BaseException
-            for _ in range(tries):
-                try:
-                    return await func(*args, **kwargs)  # type: ignore # (We know func is awaitable here)
-                except exceptions as exc:
-                    last_exc = exc
-            else:
-                raise last_exc  # type: ignore # (This won't actually be unbound)
+            return await async_retry_call(
+                lambda: func(*args, **kwargs),  # type: ignore # (We know func is awaitable here)
+                tries,
+                exceptions,
+                abort_on=abort_on,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                jitter=jitter,
+            )
 
         @wraps(func)
         def sync_wrapper(
@@ -57,14 +135,15 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
             tries: int = tries,  # type: ignore # (No support for adding kw-only args)
             **kwargs: P.kwargs,
         ) -> R:
-            last_exc: BaseException
-            for _ in range(tries):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as exc:
-                    last_exc = exc
-            else:
-                raise last_exc  # type: ignore # (This won't actually be unbound)
+            return retry_call(
+                lambda: func(*args, **kwargs),
+                tries,
+                exceptions,
+                abort_on=abort_on,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                jitter=jitter,
+            )
 
         # We cast here since pythons typing doesn't support adding keyword-only arguments to signature
         # (Support for this was a rejected idea https://peps.python.org/pep-0612/#concatenating-keyword-parameters)
@@ -75,6 +154,57 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
     return decorate
 
 
+class _Flight(Generic[R]):
+    """A single in-flight call of :class:`SingleFlight`, along with how many callers are waiting for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[R]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[R]):
+    """Coalesces concurrent calls for the same key into a single in-flight call.
+
+    While a call for some key is running, any other call for that same key
+    won't start a new one, but will instead wait for the running one and
+    receive its result (or exception). Nothing is cached once the call finishes.
+
+    The call runs in its own task, so cancelling one of the callers (including
+    the one which started it) only cancels that caller. The call itself is only
+    cancelled once all of the callers waiting for it were cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, _Flight[R]] = {}
+
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[R]]) -> R:
+        """Return the result of ``coro_factory()``, or of the already running call for ``key``, if there is one."""
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = _Flight(asyncio.ensure_future(coro_factory()))
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+
+        flight.waiters += 1
+        try:
+            # Shield the shared task, so that cancelling one of the callers doesn't cancel it for all the others
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled, nobody is interested in the result anymore
+                flight.task.cancel()
+
+    def _finish(self, key: Hashable, flight: _Flight[R]) -> None:
+        """Forget the finished call, so that the next call for its key starts a new one."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # Mark the exception as retrieved, all of the callers might have been cancelled before it was raised
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+
 class DeprecatedReturn(Protocol):
     @overload
     def __call__(self, __x: type[T]) -> type[T]: ...
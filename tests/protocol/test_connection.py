@@ -1,9 +1,17 @@
-from unittest.mock import Mock, patch
+import asyncio
+import socket
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from mcstatus.address import Address
-from mcstatus.protocol.connection import Connection, TCPSocketConnection, UDPSocketConnection
+from mcstatus.protocol.connection import (
+    Connection,
+    TCPAsyncSocketConnection,
+    TCPSocketConnection,
+    UDPAsyncSocketConnection,
+    UDPSocketConnection,
+)
 
 
 class TestConnection:
@@ -90,6 +98,20 @@ class TestConnection:
 
         assert self.connection.read_ascii() == "Hello, world!"
 
+    def test_read_ascii_consecutive(self):
+        self.connection.receive(bytearray.fromhex("610062630000"))
+
+        assert self.connection.read_ascii() == "a"
+        assert self.connection.read_ascii() == "bc"
+        assert self.connection.read_ascii() == ""
+        assert self.connection.remaining() == 0
+
+    def test_read_ascii_not_terminated(self):
+        self.connection.receive(bytearray.fromhex("6162"))
+
+        with pytest.raises(IOError):
+            self.connection.read_ascii()
+
     def test_write_ascii(self):
         self.connection.write_ascii("Hello, world!")
 
@@ -235,7 +257,7 @@ class TestTCPSocketConnection:
         test_addr = Address("localhost", 1234)
 
         socket = Mock()
-        socket.recv = Mock()
+        socket.recv_into = Mock()
         socket.send = Mock()
         with patch("socket.create_connection") as create_connection:
             create_connection.return_value = socket
@@ -254,19 +276,43 @@ class TestTCPSocketConnection:
         with pytest.raises(TypeError):
             connection.remaining()
 
+    def test_connect_timeout(self):
+        with patch("socket.create_connection") as create_connection:
+            TCPSocketConnection(Address("127.0.0.1", 1234), timeout=3, connect_timeout=0.5)
+
+        create_connection.assert_called_once_with(("127.0.0.1", 1234), timeout=0.5)
+        create_connection.return_value.settimeout.assert_called_once_with(3)
+
+    @staticmethod
+    def _fake_recv_into(*chunks: bytes):
+        """Create a ``recv_into`` side effect, which receives given chunks one by one."""
+        remaining = list(chunks)
+
+        def recv_into(buffer):
+            chunk = remaining.pop(0)
+            buffer[: len(chunk)] = chunk
+            return len(chunk)
+
+        return recv_into
+
     def test_read(self, connection):
-        connection.socket.recv.return_value = bytearray.fromhex("7FAA")
+        connection.socket.recv_into.side_effect = self._fake_recv_into(bytes.fromhex("7FAA"))
 
         assert connection.read(2) == bytearray.fromhex("7FAA")
 
+    def test_read_in_chunks(self, connection):
+        connection.socket.recv_into.side_effect = self._fake_recv_into(b"a", b"bc")
+
+        assert connection.read(3) == bytearray(b"abc")
+
     def test_read_empty(self, connection):
-        connection.socket.recv.return_value = bytearray()
+        connection.socket.recv_into.side_effect = self._fake_recv_into(b"")
 
         with pytest.raises(IOError):
             connection.read(1)
 
     def test_read_not_enough(self, connection):
-        connection.socket.recv.side_effect = [bytearray(b"a"), bytearray()]
+        connection.socket.recv_into.side_effect = self._fake_recv_into(b"a", b"")
 
         with pytest.raises(IOError):
             connection.read(2)
@@ -276,6 +322,65 @@ class TestTCPSocketConnection:
 
         connection.socket.send.assert_called_once_with(bytearray.fromhex("7FAA"))  # type: ignore[attr-defined]
 
+    def test_resolved_addresses_reused(self):
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 25565))]
+        with (
+            patch("socket.getaddrinfo", return_value=infos) as getaddrinfo,
+            patch("socket.create_connection") as create_connection,
+        ):
+            TCPSocketConnection(("resolved-once.example.org", 25565))
+            TCPSocketConnection(("resolved-once.example.org", 25565))
+
+        getaddrinfo.assert_called_once()
+        create_connection.assert_called_with(("10.0.0.1", 25565), timeout=3)
+
+    def test_resolved_addresses_expire(self):
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 25565))]
+        with (
+            patch("socket.getaddrinfo", return_value=infos) as getaddrinfo,
+            patch("socket.create_connection"),
+            patch("mcstatus.protocol.connection.time.monotonic") as monotonic,
+        ):
+            monotonic.return_value = 1000.0
+            TCPSocketConnection(("expiring.example.org", 25565))
+            monotonic.return_value = 1000.0 + 61
+            TCPSocketConnection(("expiring.example.org", 25565))
+
+        assert getaddrinfo.call_count == 2
+
+    def test_resolved_addresses_cache_size_limit(self):
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 25565))]
+        with (
+            patch("mcstatus.protocol.connection._GETADDRINFO_CACHE_SIZE", 2),
+            patch.dict("mcstatus.protocol.connection._getaddrinfo_cache", clear=True),
+            patch("socket.getaddrinfo", return_value=infos) as getaddrinfo,
+            patch("socket.create_connection"),
+        ):
+            TCPSocketConnection(("a.limited.example.org", 25565))
+            TCPSocketConnection(("b.limited.example.org", 25565))
+            TCPSocketConnection(("a.limited.example.org", 25565))  # Makes b the least recently used one
+            TCPSocketConnection(("c.limited.example.org", 25565))
+            assert getaddrinfo.call_count == 3
+
+            TCPSocketConnection(("a.limited.example.org", 25565))
+            assert getaddrinfo.call_count == 3
+            TCPSocketConnection(("b.limited.example.org", 25565))
+            assert getaddrinfo.call_count == 4
+
+    def test_connect_falls_back_to_next_address(self):
+        infos = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::2", 25565, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.2", 25565)),
+        ]
+        with (
+            patch("socket.getaddrinfo", return_value=infos),
+            patch("socket.create_connection") as create_connection,
+        ):
+            create_connection.side_effect = [OSError("Network is unreachable"), Mock()]
+            TCPSocketConnection(("fallback.example.org", 25565))
+
+        assert [call.args[0] for call in create_connection.call_args_list] == [("::2", 25565), ("10.0.0.2", 25565)]
+
 
 class TestUDPSocketConnection:
     @pytest.fixture(scope="class")
@@ -319,3 +424,69 @@ class TestUDPSocketConnection:
             bytearray.fromhex("7FAA"),
             Address("localhost", 1234),
         )
+
+
+class TestTCPAsyncSocketConnection:
+    @pytest.mark.asyncio
+    async def test_connect_happy_eyeballs(self):
+        with patch("asyncio.open_connection", AsyncMock(return_value=(Mock(), Mock()))) as open_connection:
+            async with TCPAsyncSocketConnection(Address("example.org", 25565)):
+                pass
+
+        open_connection.assert_called_once_with("example.org", 25565, happy_eyeballs_delay=0.25)
+
+    @pytest.mark.asyncio
+    async def test_connect_without_happy_eyeballs_support(self):
+        async def create_connection(protocol_factory, host=None, port=None, *, ssl=None, family=0, proto=0, flags=0):
+            raise NotImplementedError
+
+        loop = asyncio.get_running_loop()
+        with (
+            patch.object(loop, "create_connection", create_connection),
+            patch("asyncio.open_connection", AsyncMock(return_value=(Mock(), Mock()))) as open_connection,
+        ):
+            async with TCPAsyncSocketConnection(Address("example.org", 25565)):
+                pass
+
+        open_connection.assert_called_once_with("example.org", 25565)
+
+
+class TestUDPAsyncSocketConnection:
+    @pytest.mark.asyncio
+    async def test_write_and_read(self):
+        class EchoProtocol(asyncio.DatagramProtocol):
+            def connection_made(self, transport):
+                self.transport = transport
+
+            def datagram_received(self, data, addr):
+                self.transport.sendto(data[::-1], addr)
+
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(EchoProtocol, local_addr=("127.0.0.1", 0))
+        try:
+            port = transport.get_extra_info("sockname")[1]
+            async with UDPAsyncSocketConnection(Address("127.0.0.1", port), timeout=1) as connection:
+                await connection.write(bytearray.fromhex("7FAA"))
+                assert await connection.read(2) == bytearray.fromhex("AA7F")
+        finally:
+            transport.close()
+
+    @pytest.mark.asyncio
+    async def test_socket_closed_on_failed_connect(self):
+        connection = UDPAsyncSocketConnection(Address("127.0.0.1", 25565), timeout=1)
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "sock_connect", AsyncMock(side_effect=OSError)), pytest.raises(OSError):
+            await connection.connect()
+
+        assert connection.socket.fileno() == -1
+
+    @pytest.mark.asyncio
+    async def test_read_timeout(self):
+        # Bind a socket which never answers, so the read has to time out
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+            silent.bind(("127.0.0.1", 0))
+            port = silent.getsockname()[1]
+            async with UDPAsyncSocketConnection(Address("127.0.0.1", port), timeout=0.01) as connection:
+                await connection.write(bytearray.fromhex("7FAA"))
+                with pytest.raises(asyncio.TimeoutError):
+                    await connection.read(2)
@@ -1,9 +1,25 @@
+import sys
+
+import pytest
 from pytest import raises
 
-from mcstatus.responses import BaseStatusResponse
+from mcstatus.responses import BaseStatusResponse, JavaStatusResponse
 
 
 class TestMCStatusResponse:
     def test_raises_not_implemented_error_on_build(self):
         with raises(NotImplementedError):
             BaseStatusResponse.build({"foo": "bar"})  # type: ignore # method is abstract
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_responses_have_no_instance_dict(self):
+        response = JavaStatusResponse.build(
+            {
+                "players": {"max": 20, "online": 1, "sample": [{"name": "foo", "id": "0b3717c4-f45d-47c8-b8e2-3d9ff6f93a89"}]},
+                "version": {"name": "1.8-pre1", "protocol": 44},
+                "description": "A Minecraft Server",
+            }
+        )
+
+        for obj in (response, response.players, response.players.sample[0], response.version):  # type: ignore # sample is set
+            assert not hasattr(obj, "__dict__")
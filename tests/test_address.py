@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
+import socket
+import subprocess
 import sys
 from pathlib import Path
 from typing import cast
@@ -13,7 +16,17 @@ from dns.rdatatype import RdataType
 from mcstatus.address import Address, async_minecraft_srv_address_lookup, minecraft_srv_address_lookup
 
 
+def test_import_does_not_import_dnspython():
+    code = "import sys, mcstatus; assert 'dns' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 class TestSRVLookup:
+    @staticmethod
+    def _srv_calls(resolve: Mock) -> int:
+        """Count the calls of given mocked resolve function, which queried for an SRV record."""
+        return sum(1 for call in resolve.call_args_list if call.args[1] == RdataType.SRV)
+
     @pytest.mark.parametrize("exception", [dns.resolver.NXDOMAIN, dns.resolver.NoAnswer])
     def test_address_no_srv(self, exception):
         with patch("dns.resolver.resolve") as resolve:
@@ -36,13 +49,46 @@ class TestSRVLookup:
         assert address.host == "different.example.org"
         assert address.port == 12345
 
+    @pytest.mark.asyncio
+    async def test_address_lookup_in_event_loop_warns(self):
+        with patch("dns.resolver.resolve") as resolve, pytest.warns(RuntimeWarning, match="blocks the running event loop"):
+            resolve.side_effect = [dns.resolver.NXDOMAIN]
+            address = minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
+
+        assert address == ("example.org", 25565)
+
+    @pytest.mark.asyncio
+    async def test_address_lookup_in_event_loop_warning_points_at_caller(self):
+        with patch("dns.resolver.resolve", side_effect=dns.resolver.NXDOMAIN), pytest.warns(RuntimeWarning) as record:
+            minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
+
+        assert record[0].filename == __file__
+
+    @pytest.mark.asyncio
+    async def test_address_lookup_in_event_loop_without_query_doesnt_warn(self, recwarn):
+        assert minecraft_srv_address_lookup("example.org:4444") == ("example.org", 4444)
+        assert minecraft_srv_address_lookup("127.0.0.1", default_port=25565) == ("127.0.0.1", 25565)
+        assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("exception", [dns.resolver.NXDOMAIN, dns.resolver.NoAnswer])
     async def test_async_address_no_srv(self, exception):
-        with patch("dns.asyncresolver.resolve") as resolve:
-            resolve.side_effect = [exception]
+        a_answer = MagicMock()
+        cast(MagicMock, a_answer.__str__).return_value = "48.225.1.104."
+
+        def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.SRV:
+                raise exception
+            return [a_answer]
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve) as resolve:
             address = await async_minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
-            resolve.assert_called_once_with("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("example.org", RdataType.A, lifetime=3, search=True)
+
+            # The A record resolved alongside the SRV lookup is reused
+            assert str(await address.async_resolve_ip()) == "48.225.1.104"
+            assert resolve.call_count == 2
 
         assert address.host == "example.org"
         assert address.port == 25565
@@ -56,10 +102,112 @@ class TestSRVLookup:
             resolve.return_value = [answer]
 
             address = await async_minecraft_srv_address_lookup("example.org", lifetime=3)
-            resolve.assert_called_once_with("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
         assert address.host == "different.example.org"
         assert address.port == 12345
 
+    @pytest.mark.asyncio
+    async def test_async_address_with_srv_cancels_ip_lookup(self):
+        a_cancelled = asyncio.Event()
+
+        async def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype != RdataType.SRV:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    a_cancelled.set()
+                    raise
+            answer = Mock()
+            answer.target = "different.example.org."
+            answer.port = 12345
+            return [answer]
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve):
+            address = await async_minecraft_srv_address_lookup("example.org", lifetime=3)
+            # The server is on a different host, so the IP of this one isn't needed
+            await asyncio.wait_for(a_cancelled.wait(), timeout=1)
+
+        assert address == ("different.example.org", 12345)
+
+    @pytest.mark.parametrize(
+        ("address", "ip"),
+        [("127.0.0.1", "127.0.0.1"), ("[::1]", "::1"), ("localhost", "localhost"), ("mc.localhost", "mc.localhost")],
+    )
+    def test_address_ip_no_srv_query(self, address, ip):
+        with patch("dns.resolver.resolve") as resolve:
+            result = minecraft_srv_address_lookup(address, default_port=25565)
+            resolve.assert_not_called()
+
+        assert result == (ip, 25565)
+
+    def test_address_ip_no_default_port(self):
+        with patch("dns.resolver.resolve") as resolve, pytest.raises(ValueError):
+            minecraft_srv_address_lookup("127.0.0.1")
+        resolve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_address_ip_no_srv_query(self):
+        with patch("dns.asyncresolver.resolve") as resolve:
+            address = await async_minecraft_srv_address_lookup("127.0.0.1", default_port=25565)
+            resolve.assert_not_called()
+
+        assert address == ("127.0.0.1", 25565)
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_srv_lookups_coalesced(self):
+        answer = Mock()
+        answer.target = "different.example.org."
+        answer.port = 12345
+
+        async def fake_resolve(*args, **kwargs):
+            await asyncio.sleep(0)  # Give the other lookups a chance to start while this one is in flight
+            return [answer]
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve) as resolve:
+            addresses = await asyncio.gather(
+                *(async_minecraft_srv_address_lookup("example.org", lifetime=3) for _ in range(5))
+            )
+            assert self._srv_calls(resolve) == 1
+
+            # Once the lookup finished, nothing is kept around
+            await async_minecraft_srv_address_lookup("example.org", lifetime=3)
+            assert self._srv_calls(resolve) == 2
+
+        assert all(address == ("different.example.org", 12345) for address in addresses)
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_srv_lookups_with_different_resolvers_not_coalesced(self):
+        answer = Mock()
+        answer.target = "different.example.org."
+        answer.port = 12345
+
+        async def fake_resolve(*args, **kwargs):
+            await asyncio.sleep(0)
+            return [answer]
+
+        resolvers = [Mock(), Mock()]
+        for resolver in resolvers:
+            resolver.resolve = Mock(side_effect=fake_resolve)
+
+        await asyncio.gather(*(async_minecraft_srv_address_lookup("example.org", resolver=resolver) for resolver in resolvers))
+
+        assert all(self._srv_calls(resolver.resolve) == 1 for resolver in resolvers)
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_srv_lookups_share_exception(self):
+        async def fake_resolve(*args, **kwargs):
+            await asyncio.sleep(0)
+            raise dns.resolver.NXDOMAIN
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve) as resolve:
+            results = await asyncio.gather(
+                *(async_minecraft_srv_address_lookup("example.org") for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert self._srv_calls(resolve) == 1
+
+        assert all(isinstance(result, ValueError) for result in results)
+
 
 class TestAddressValidity:
     @pytest.mark.parametrize(
@@ -99,6 +247,13 @@ class TestAddressConstructing:
         assert addr.host == "example.org"
         assert addr.port == 25565
 
+    def test_no_instance_state_until_resolved(self):
+        addr = Address("1.2.3.4", 25565)
+        assert vars(addr) == {}
+
+        addr.resolve_ip()
+        assert str(vars(addr)["_cached_ip"]) == "1.2.3.4"
+
     def test_tuple_behavior(self):
         addr = Address("example.org", 25565)
         assert isinstance(addr, tuple)
@@ -175,6 +330,114 @@ class TestAddressIPResolving:
             assert isinstance(resolved_ip, ipaddress.IPv4Address)
             assert str(resolved_ip) == "48.225.1.104"
 
+    def test_ip_resolver_falls_back_to_aaaa(self):
+        def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.A:
+                raise dns.resolver.NoAnswer
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "2001:db8::1"
+            return [answer]
+
+        with patch("dns.resolver.resolve", side_effect=fake_resolve) as resolve:
+            resolved_ip = self.host_addr.resolve_ip(lifetime=3)
+
+        resolve.assert_called_with(self.host_addr.host, RdataType.AAAA, lifetime=3, search=True)
+        assert resolved_ip == ipaddress.ip_address("2001:db8::1")
+
+    def test_ip_resolver_no_aaaa_fallback_on_nxdomain(self):
+        with patch("dns.resolver.resolve", side_effect=dns.resolver.NXDOMAIN) as resolve, pytest.raises(dns.resolver.NXDOMAIN):
+            self.host_addr.resolve_ip(lifetime=3)
+
+        resolve.assert_called_once()
+
+    def test_ip_resolver_uses_given_resolver(self):
+        answer = MagicMock()
+        cast(MagicMock, answer.__str__).return_value = "48.225.1.104."
+        resolver = Mock()
+        resolver.resolve.return_value = [answer]
+
+        with patch("dns.resolver.resolve") as resolve:
+            resolved_ip = self.host_addr.resolve_ip(lifetime=3, resolver=resolver)
+
+        resolve.assert_not_called()
+        resolver.resolve.assert_called_once_with(self.host_addr.host, RdataType.A, lifetime=3, search=True)
+        assert str(resolved_ip) == "48.225.1.104"
+
+    @pytest.mark.asyncio
+    async def test_async_ip_resolver_falls_back_to_aaaa(self):
+        def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.A:
+                raise dns.resolver.NoAnswer
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "2001:db8::1"
+            return [answer]
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve):
+            resolved_ip = await self.host_addr.async_resolve_ip(lifetime=3)
+
+        assert resolved_ip == ipaddress.ip_address("2001:db8::1")
+
+    @pytest.mark.asyncio
+    async def test_async_ip_resolver_cancels_aaaa_once_a_resolved(self):
+        aaaa_cancelled = asyncio.Event()
+
+        async def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.AAAA:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    aaaa_cancelled.set()
+                    raise
+            await asyncio.sleep(0)  # Let the AAAA query start in the meantime
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "48.225.1.104."
+            return [answer]
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve) as resolve:
+            resolved_ip = await self.host_addr.async_resolve_ip(lifetime=3)
+            await asyncio.wait_for(aaaa_cancelled.wait(), timeout=1)
+
+        resolve.assert_any_call(self.host_addr.host, RdataType.AAAA, lifetime=3, search=True)
+        assert str(resolved_ip) == "48.225.1.104"
+
+    @pytest.mark.asyncio
+    async def test_async_ip_resolver_raises_a_record_error(self):
+        def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.A:
+                raise dns.resolver.NXDOMAIN
+            raise dns.resolver.NoAnswer
+
+        with patch("dns.asyncresolver.resolve", side_effect=fake_resolve), pytest.raises(dns.resolver.NXDOMAIN):
+            await self.host_addr.async_resolve_ip(lifetime=3)
+
+    def test_ip_resolver_caches_resolved_ip(self):
+        with patch("dns.resolver.resolve") as resolve:
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "48.225.1.104."
+            resolve.return_value = [answer]
+
+            first = self.host_addr.resolve_ip()
+            second = self.host_addr.resolve_ip()
+
+            resolve.assert_called_once()
+            assert first is second
+
+    def test_ip_resolver_cache_expires(self):
+        with patch("dns.resolver.resolve") as resolve, patch("mcstatus.address.time.monotonic") as monotonic:
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "48.225.1.104."
+            resolve.return_value = [answer]
+
+            monotonic.return_value = 1000.0
+            self.host_addr.resolve_ip()
+            monotonic.return_value = 1000.0 + 299
+            self.host_addr.resolve_ip()
+            assert resolve.call_count == 1
+
+            monotonic.return_value = 1000.0 + 301
+            self.host_addr.resolve_ip()
+            assert resolve.call_count == 2
+
     def test_ip_resolver_with_ipv4(self):
         with patch("dns.resolver.resolve") as resolve:
             resolved_ip = self.ipv4_addr.resolve_ip(lifetime=3)
@@ -212,14 +475,27 @@ class TestAddressIPResolving:
     def test_resolve_localhost(self):
         addr = Address("localhost", 25565)
 
-        context_manager = pytest.warns(RuntimeWarning) if sys.platform == "darwin" else MagicMock()
-        with context_manager:
+        with patch("dns.resolver.resolve") as resolve:
             assert addr.resolve_ip() == ipaddress.ip_address("127.0.0.1")
+        resolve.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_resolve_localhost(self):
         addr = Address("localhost", 25565)
 
-        context_manager = pytest.warns(RuntimeWarning) if sys.platform == "darwin" else MagicMock()
-        with context_manager:
+        with patch("dns.asyncresolver.resolve") as resolve:
             assert await addr.async_resolve_ip() == ipaddress.ip_address("127.0.0.1")
+        resolve.assert_not_called()
+
+    def test_resolve_localhost_prefers_ipv4(self):
+        addr_infos = [
+            (socket.AF_INET6, socket.SOCK_DGRAM, 17, "", ("::1", 0, 0, 0)),
+            (socket.AF_INET, socket.SOCK_DGRAM, 17, "", ("127.0.0.1", 0)),
+        ]
+        with patch("socket.getaddrinfo", return_value=addr_infos):
+            assert Address("localhost", 25565).resolve_ip() == ipaddress.ip_address("127.0.0.1")
+
+    def test_resolve_localhost_ipv6_only(self):
+        addr_infos = [(socket.AF_INET6, socket.SOCK_DGRAM, 17, "", ("::1", 0, 0, 0))]
+        with patch("socket.getaddrinfo", return_value=addr_infos):
+            assert Address("localhost", 25565).resolve_ip() == ipaddress.ip_address("::1")
@@ -61,3 +61,44 @@ async def test_async_latency_is_real_number():
 
         # we slept 1ms, so this should be always ~1.
         assert mocked_parse_response.call_args[0][1] >= 1
+
+
+def test_context_manager_reuses_socket():
+    with mock.patch("mcstatus.bedrock_status.socket.socket") as socket_cls:
+        sock = socket_cls.return_value
+        sock.recvfrom.return_value = (b"data", None)
+
+        with BedrockServerStatus(Address("localhost", 19132)) as status:
+            assert status._read_status() == b"data"
+            assert status._read_status() == b"data"
+            sock.close.assert_not_called()
+
+    socket_cls.assert_called_once()
+    assert sock.sendto.call_count == 2
+    sock.close.assert_called_once()
+
+
+def test_socket_closed_without_context_manager():
+    with mock.patch("mcstatus.bedrock_status.socket.socket") as socket_cls:
+        sock = socket_cls.return_value.__enter__.return_value
+        sock.recvfrom.return_value = (b"data", None)
+
+        assert BedrockServerStatus(Address("localhost", 19132))._read_status() == b"data"
+
+    socket_cls.return_value.__exit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_reuses_stream():
+    stream = mock.Mock()
+    stream.send = mock.AsyncMock()
+    stream.recv = mock.AsyncMock(return_value=(b"data", None))
+    with mock.patch("mcstatus.bedrock_status.asyncio_dgram.connect", mock.AsyncMock(return_value=stream)) as connect:
+        async with BedrockServerStatus(Address("localhost", 19132)) as status:
+            assert await status._read_status_async() == b"data"
+            assert await status._read_status_async() == b"data"
+            stream.close.assert_not_called()
+
+    connect.assert_called_once()
+    assert stream.send.call_count == 2
+    stream.close.assert_called_once()
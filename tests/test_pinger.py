@@ -5,7 +5,7 @@ from unittest import mock
 import pytest
 
 from mcstatus.address import Address
-from mcstatus.pinger import ServerPinger
+from mcstatus.pinger import ServerPinger, encode_handshake
 from mcstatus.protocol.connection import Connection
 
 
@@ -22,6 +22,38 @@ class TestServerPinger:
 
         assert self.pinger.connection.flush() == bytearray.fromhex("0F002C096C6F63616C686F737463DD01")
 
+    def test_encode_handshake(self):
+        packet = encode_handshake(Address("localhost", 25565), 44)
+
+        assert packet == bytes.fromhex("0F002C096C6F63616C686F737463DD01")
+
+    def test_handshake_and_request_status(self):
+        self.pinger.handshake_and_request_status()
+
+        assert self.pinger.connection.flush() == bytearray.fromhex("0F002C096C6F63616C686F737463DD01" + "0100")
+
+    def test_read_status_response(self):
+        self.pinger.connection.receive(
+            bytearray.fromhex(
+                "7200707B226465736372697074696F6E223A2241204D696E65637261667420536572766572222C22706C6179657273223A7B2"
+                "26D6178223A32302C226F6E6C696E65223A307D2C2276657273696F6E223A7B226E616D65223A22312E382D70726531222C22"
+                "70726F746F636F6C223A34347D7D"
+            )
+        )
+        status = self.pinger.read_status_response()
+
+        assert status.raw["description"] == "A Minecraft Server"
+        # Nothing gets sent, the request was already written along with the handshake
+        assert self.pinger.connection.flush() == bytearray()
+
+    def test_encode_handshake_cached(self):
+        first = encode_handshake(Address("cached.example.org", 25565), 47)
+        second = encode_handshake(Address("cached.example.org", 25565), 47)
+        other_version = encode_handshake(Address("cached.example.org", 25565), 760)
+
+        assert first is second
+        assert other_version != first
+
     def test_read_status(self):
         self.pinger.connection.receive(
             bytearray.fromhex(
@@ -1,6 +1,8 @@
+from unittest.mock import patch
+
 import pytest
 
-from mcstatus.utils import retry
+from mcstatus.utils import async_retry_call, retry, retry_backoff, retry_call
 from tests.test_async_pinger import async_decorator
 
 
@@ -64,3 +66,81 @@ def test_async_fail():
     # We should get the last exception on failure (not OSError)
     with pytest.raises(RuntimeError):
         async_decorator(func)()
+
+
+def test_sync_abort_on():
+    x = 0
+
+    @retry(tries=3, abort_on=(ConnectionRefusedError,))
+    def func():
+        nonlocal x
+        x += 1
+        raise ConnectionRefusedError("Refused")
+
+    with pytest.raises(ConnectionRefusedError):
+        func()
+    assert x == 1
+
+
+def test_async_abort_on():
+    x = 0
+
+    @retry(tries=3, abort_on=(ConnectionRefusedError,))
+    async def func():
+        nonlocal x
+        x += 1
+        raise ConnectionRefusedError("Refused")
+
+    with pytest.raises(ConnectionRefusedError):
+        async_decorator(func)()
+    assert x == 1
+
+
+def test_sync_backoff_between_tries():
+    @retry(tries=3, base_delay=0.1, jitter=0)
+    def func():
+        raise OSError("Error")
+
+    with patch("mcstatus.utils.time.sleep") as sleep, pytest.raises(OSError):
+        func()
+
+    # No sleep before the first try, nor after the last one
+    assert [call.args[0] for call in sleep.call_args_list] == [0.1, 0.2]
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 5, 20])
+def test_backoff_bounds(attempt):
+    expected = min(1.0, 0.05 * 2**attempt)
+    for _ in range(50):
+        assert expected * 0.5 <= retry_backoff(attempt) <= expected * 1.5
+
+
+def test_backoff_without_jitter():
+    assert [retry_backoff(attempt, base_delay=1, max_delay=5, jitter=0) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_retry_call():
+    results = iter([OSError, OSError, 5])
+
+    def func():
+        result = next(results)
+        if result is OSError:
+            raise OSError
+        return result
+
+    with patch("mcstatus.utils.time.sleep"):
+        assert retry_call(func, 3, (OSError,)) == 5
+
+
+def test_async_retry_call_abort_on():
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        raise ConnectionRefusedError
+
+    with pytest.raises(ConnectionRefusedError):
+        async_decorator(async_retry_call)(func, 3, (OSError,), abort_on=(ConnectionRefusedError,))
+
+    assert calls == 1
@@ -1,11 +1,19 @@
 import asyncio
-from unittest.mock import patch
+import ipaddress
+import subprocess
+import sys
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+import dns.resolver
 import pytest_asyncio
+from dns.rdatatype import RdataType
 
+from mcstatus.address import Address
+from mcstatus.bedrock_status import BedrockServerStatus
 from mcstatus.protocol.connection import Connection
-from mcstatus.server import BedrockServer, JavaServer
+from mcstatus.server import BedrockServer, JavaServer, _get_async_resolver, _get_resolver
 
 
 class MockProtocolFactory(asyncio.Protocol):
@@ -69,6 +77,114 @@ class TestBedrockServer:
         assert s.address.host == "example.org"
         assert s.address.port == 19132
 
+    @pytest.mark.parametrize(("address", "port"), [("[::1]", 19132), ("[::1]:19133", 19133)])
+    def test_lookup_ipv6(self, address, port):
+        s = BedrockServer.lookup(address)
+        assert s.address.host == "::1"
+        assert s.address.port == port
+
+    def test_from_resolved_constructor(self):
+        s = BedrockServer.from_resolved("::1")
+        assert s.address.host == "::1"
+        assert s.address.port == 19132
+
+    @pytest.mark.asyncio
+    async def test_async_status_many(self):
+        error = IOError("no response")
+        with patch.object(BedrockServer, "async_status", AsyncMock(side_effect=["status", error])):
+            results = await BedrockServer.async_status_many(["example.org", "example.com:1234"])
+
+        assert results == [("example.org", "status"), ("example.com:1234", error)]
+
+    def test_status_many(self):
+        error = IOError("no response")
+
+        def fake_status(server, **kwargs):
+            if server.address.port == 1234:
+                raise error
+            return "status"
+
+        with patch.object(BedrockServer, "status", autospec=True, side_effect=fake_status):
+            results = BedrockServer.status_many(["example.org", "example.com:1234"])
+
+        assert results == [("example.org", "status"), ("example.com:1234", error)]
+
+    @pytest.mark.asyncio
+    async def test_async_status_coalesced(self):
+        calls = 0
+
+        async def fake_status(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "status"
+
+        with patch.object(BedrockServer, "_async_status", fake_status):
+            results = await asyncio.gather(self.server.async_status(coalesce=True), self.server.async_status(coalesce=True))
+            assert results == ["status"] * 2
+            assert calls == 1
+
+            # Different tries is a different request
+            await asyncio.gather(self.server.async_status(coalesce=True), self.server.async_status(tries=1, coalesce=True))
+            assert calls == 3
+
+            # Not coalesced by default
+            await asyncio.gather(self.server.async_status(), self.server.async_status())
+            assert calls == 5
+
+    def test_status_retries_reuse_socket(self):
+        with (
+            patch("mcstatus.bedrock_status.socket.socket") as socket_cls,
+            patch.object(BedrockServerStatus, "parse_response", return_value="status"),
+            patch("mcstatus.server.time.sleep"),
+        ):
+            sock = socket_cls.return_value
+            sock.recvfrom.side_effect = [TimeoutError, TimeoutError, (b"data", None)]
+
+            assert self.server.status() == "status"
+
+        socket_cls.assert_called_once()
+        assert sock.sendto.call_count == 3
+        sock.close.assert_called_once()
+
+    def test_status_connection_refused_not_retried(self):
+        with patch("mcstatus.bedrock_status.socket.socket") as socket_cls:
+            sock = socket_cls.return_value
+            sock.recvfrom.side_effect = ConnectionRefusedError
+
+            with pytest.raises(ConnectionRefusedError):
+                self.server.status()
+
+        sock.sendto.assert_called_once()
+
+    def test_status_parse_error_not_retried(self):
+        with (
+            patch("mcstatus.bedrock_status.socket.socket") as socket_cls,
+            patch.object(BedrockServerStatus, "parse_response", side_effect=ValueError),
+        ):
+            socket_cls.return_value.recvfrom.return_value = (b"data", None)
+
+            with pytest.raises(ValueError):
+                self.server.status()
+
+        socket_cls.return_value.sendto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_status_connect_retried(self):
+        stream = Mock()
+        stream.send = AsyncMock()
+        stream.recv = AsyncMock(return_value=(b"data", None))
+        with (
+            patch("mcstatus.bedrock_status.asyncio_dgram.connect", AsyncMock(side_effect=[OSError, stream])) as connect,
+            patch.object(BedrockServerStatus, "parse_response", return_value="status"),
+            patch("mcstatus.utils.asyncio.sleep", AsyncMock()),
+        ):
+            assert await self.server.async_status() == "status"
+
+        assert connect.call_count == 2
+        stream.send.assert_called_once()
+        stream.close.assert_called_once()
+
 
 class TestAsyncJavaServer:
     @pytest.mark.asyncio
@@ -76,19 +192,135 @@ class TestAsyncJavaServer:
         await create_mock_packet_server(
             port=unused_tcp_port,
             data_expected_to_receive=bytearray.fromhex("09010000000001C54246"),
-            data_to_respond_with=bytearray.fromhex("0F002F096C6F63616C686F737463DD0109010000000001C54246"),
+            data_to_respond_with=bytearray.fromhex("09010000000001C54246"),
         )
         minecraft_server = JavaServer("localhost", port=unused_tcp_port)
 
         latency = await minecraft_server.async_ping(ping_token=29704774, version=47)
         assert latency >= 0
 
+    @pytest.mark.asyncio
+    async def test_async_status_many(self):
+        error = IOError("no response")
+        with patch.object(JavaServer, "async_status", AsyncMock(side_effect=["first", error, "third"])):
+            results = await JavaServer.async_status_many(["a.example.org:1", "b.example.org:2", "c.example.org:3"])
+
+        assert results == [("a.example.org:1", "first"), ("b.example.org:2", error), ("c.example.org:3", "third")]
+
+    @pytest.mark.asyncio
+    async def test_async_ping_many(self):
+        error = IOError("no response")
+        with patch.object(JavaServer, "async_ping", AsyncMock(side_effect=[12.5, error])):
+            results = await JavaServer.async_ping_many(["a.example.org:1", "b.example.org:2"])
+
+        assert results == [("a.example.org:1", 12.5), ("b.example.org:2", error)]
+
+    @pytest.mark.asyncio
+    async def test_async_query_many(self):
+        error = IOError("no response")
+        with patch.object(JavaServer, "async_query", AsyncMock(side_effect=[error, "query"])):
+            results = await JavaServer.async_query_many(["a.example.org:1", "b.example.org:2"])
+
+        assert results == [("a.example.org:1", error), ("b.example.org:2", "query")]
+
+    @pytest.mark.asyncio
+    async def test_async_status_many_concurrency_limit(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_status(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "status"
+
+        with patch.object(JavaServer, "async_status", fake_status):
+            addresses = [f"example.org:{port}" for port in range(1, 11)]
+            results = await JavaServer.async_status_many(addresses, concurrency=3)
+
+        assert [result for _, result in results] == ["status"] * 10
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_async_status_coalesced(self):
+        calls = 0
+
+        async def fake_status(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "status"
+
+        server = JavaServer("localhost")
+        with patch.object(JavaServer, "_async_status", fake_status):
+            results = await asyncio.gather(*(server.async_status(coalesce=True) for _ in range(3)))
+            assert results == ["status"] * 3
+            assert calls == 1
+
+            # Different version is a different request
+            await asyncio.gather(server.async_status(coalesce=True), server.async_status(version=765, coalesce=True))
+            assert calls == 3
+
+            # So is a different timeout
+            other = JavaServer("localhost", timeout=10)
+            await asyncio.gather(server.async_status(coalesce=True), other.async_status(coalesce=True))
+            assert calls == 5
+
+            # Not coalesced by default
+            await asyncio.gather(*(server.async_status() for _ in range(3)))
+            assert calls == 8
+
+    @pytest.mark.asyncio
+    async def test_async_full_info(self):
+        server = JavaServer("localhost")
+        error = IOError("no response")
+        with (
+            patch.object(JavaServer, "async_status", AsyncMock(return_value="status")),
+            patch.object(JavaServer, "async_query", AsyncMock(side_effect=error)),
+        ):
+            assert await server.async_full_info() == ("status", error)
+
     @pytest.mark.asyncio
     async def test_async_lookup_constructor(self):
         s = await JavaServer.async_lookup("example.org:3333")
         assert s.address.host == "example.org"
         assert s.address.port == 3333
 
+    @pytest.mark.asyncio
+    async def test_async_lookup_without_srv(self):
+        with patch("mcstatus.server._async_minecraft_srv_address_lookup") as srv_lookup:
+            s = await JavaServer.async_lookup("example.org", resolve_srv=False)
+
+        srv_lookup.assert_not_called()
+        assert s.address == ("example.org", 25565)
+
+    @pytest.mark.asyncio
+    async def test_async_lookup_keeps_resolved_ip(self):
+        JavaServer.clear_lookup_cache()
+        a_answer = MagicMock()
+        cast(MagicMock, a_answer.__str__).return_value = "48.225.1.104."
+
+        async def fake_resolve(query_name, rdtype, **kwargs):
+            if rdtype == RdataType.SRV:
+                raise dns.resolver.NXDOMAIN
+            return [a_answer]
+
+        resolver = Mock()
+        resolver.resolve = Mock(side_effect=fake_resolve)
+        JavaServer.set_resolver(async_resolver=resolver)
+        try:
+            s = await JavaServer.async_lookup("example.org")
+        finally:
+            JavaServer.set_resolver(None, None)
+            JavaServer.clear_lookup_cache()
+
+        assert s.address == ("example.org", 25565)
+        # The IP resolved along with the SRV lookup is used to connect, without resolving the host again
+        assert s._get_connect_address() == ("48.225.1.104", 25565)
+        assert resolver.resolve.call_count == 2
+
 
 class TestJavaServer:
     def setup_method(self):
@@ -98,6 +330,9 @@ class TestJavaServer:
     def test_default_port(self):
         assert self.server.address.port == 25565
 
+    def test_no_instance_dict(self):
+        assert not hasattr(self.server, "__dict__")
+
     def test_ping(self):
         self.socket.receive(bytearray.fromhex("09010000000001C54246"))
 
@@ -109,13 +344,30 @@ class TestJavaServer:
         assert self.socket.remaining() == 0, "Data is pending to be read, but should be empty"
         assert latency >= 0
 
+    def test_connect_timeout(self):
+        server = JavaServer("localhost", timeout=5, connect_timeout=1)
+        with patch("mcstatus.server.TCPSocketConnection") as connection, patch("mcstatus.server.ServerPinger"):
+            server.status()
+
+        assert connection.call_args.args[1:] == (5, 1)
+
+    def test_connect_timeout_defaults_to_timeout(self):
+        assert JavaServer("localhost", timeout=5).connect_timeout == 5
+
     def test_ping_retry(self):
         # Use a blank mock for the connection, we don't want to actually create any connections
+        with patch("mcstatus.server.TCPSocketConnection"), patch("mcstatus.server.ServerPinger") as pinger:
+            pinger.side_effect = [IOError, IOError, IOError]
+            with pytest.raises(IOError):
+                self.server.ping()
+            assert pinger.call_count == 3
+
+    def test_ping_no_retry_on_unexpected_error(self):
         with patch("mcstatus.server.TCPSocketConnection"), patch("mcstatus.server.ServerPinger") as pinger:
             pinger.side_effect = [RuntimeError, RuntimeError, RuntimeError]
             with pytest.raises(RuntimeError):
                 self.server.ping()
-            assert pinger.call_count == 3
+            assert pinger.call_count == 1
 
     def test_status(self):
         self.socket.receive(
@@ -142,11 +394,44 @@ class TestJavaServer:
     def test_status_retry(self):
         # Use a blank mock for the connection, we don't want to actually create any connections
         with patch("mcstatus.server.TCPSocketConnection"), patch("mcstatus.server.ServerPinger") as pinger:
-            pinger.side_effect = [RuntimeError, RuntimeError, RuntimeError]
-            with pytest.raises(RuntimeError):
+            pinger.side_effect = [IOError, IOError, IOError]
+            with pytest.raises(IOError):
                 self.server.status()
             assert pinger.call_count == 3
 
+    def test_status_retry_new_connection(self):
+        with patch("mcstatus.server.TCPSocketConnection") as connection, patch("mcstatus.server.ServerPinger") as pinger:
+            pinger.side_effect = [IOError, IOError, IOError]
+            with pytest.raises(IOError):
+                self.server.status()
+            assert connection.call_count == 3
+
+    def test_status_connects_to_cached_ip(self):
+        with (
+            patch("mcstatus.server.TCPSocketConnection") as connection,
+            patch("mcstatus.server.ServerPinger") as pinger,
+            patch.object(self.server.address, "_get_cached_ip", return_value=ipaddress.ip_address("1.2.3.4")),
+        ):
+            self.server.status()
+
+        connection.assert_called_once_with(("1.2.3.4", 25565), self.server.timeout, self.server.connect_timeout)
+        # The handshake still has to contain the original host
+        assert pinger.call_args.kwargs["address"] is self.server.address
+
+    def test_status_connection_refused_no_retry(self):
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.side_effect = ConnectionRefusedError
+            with pytest.raises(ConnectionRefusedError):
+                self.server.status()
+            assert connection.call_count == 1
+
+    def test_status_retry_custom_tries(self):
+        with patch("mcstatus.server.TCPSocketConnection"), patch("mcstatus.server.ServerPinger") as pinger:
+            pinger.side_effect = [IOError] * 5
+            with pytest.raises(IOError):
+                self.server.status(tries=5)
+            assert pinger.call_count == 5
+
     def test_query(self):
         self.socket.receive(bytearray.fromhex("090000000035373033353037373800"))
         self.socket.receive(
@@ -164,7 +449,7 @@ class TestJavaServer:
 
             with (
                 patch("mcstatus.server.UDPSocketConnection") as connection,
-                patch.object(self.server.address, "resolve_ip") as resolve_ip,
+                patch.object(self.server.address, "_resolve_ip") as resolve_ip,
             ):
                 connection.return_value.__enter__.return_value = self.socket
                 resolve_ip.return_value = "127.0.0.1"
@@ -188,13 +473,208 @@ class TestJavaServer:
     def test_query_retry(self):
         # Use a blank mock for the connection, we don't want to actually create any connections
         with patch("mcstatus.server.UDPSocketConnection"), patch("mcstatus.server.ServerQuerier") as querier:
-            querier.side_effect = [RuntimeError, RuntimeError, RuntimeError]
-            with pytest.raises(RuntimeError), patch.object(self.server.address, "resolve_ip") as resolve_ip:
+            querier.side_effect = [IOError, IOError, IOError]
+            with pytest.raises(IOError), patch.object(self.server.address, "_resolve_ip") as resolve_ip:
                 resolve_ip.return_value = "127.0.0.1"
                 self.server.query()
             assert querier.call_count == 3
 
+    def test_query_uses_set_resolver(self):
+        answer = MagicMock()
+        cast(MagicMock, answer.__str__).return_value = "127.0.0.1"
+        resolver = Mock()
+        resolver.resolve.return_value = [answer]
+        server = JavaServer("example.org")
+
+        JavaServer.set_resolver(resolver)
+        try:
+            with patch("mcstatus.server.UDPSocketConnection") as connection, patch("mcstatus.server.ServerQuerier"):
+                server.query()
+        finally:
+            JavaServer.set_resolver(None, None)
+
+        resolver.resolve.assert_called_once_with("example.org", RdataType.A, lifetime=None, search=True)
+        assert connection.call_args.args[0] == ("127.0.0.1", server.address.port)
+
+    def test_query_ip_host_not_resolved(self):
+        server = JavaServer("127.0.0.1")
+        with (
+            patch("mcstatus.server.UDPSocketConnection") as connection,
+            patch("mcstatus.server.ServerQuerier"),
+            patch.object(server.address, "_resolve_ip") as resolve_ip,
+        ):
+            server.query()
+
+        resolve_ip.assert_not_called()
+        connection.assert_called_once_with(server.address, server.timeout)
+
+    def test_query_localhost_does_not_create_resolver(self):
+        server = JavaServer("localhost")
+        with (
+            patch("mcstatus.server.UDPSocketConnection"),
+            patch("mcstatus.server.ServerQuerier"),
+            patch("mcstatus.server._get_resolver") as get_resolver,
+        ):
+            server.query()
+
+        # Localhost is resolved by the OS, no DNS query is made, so the resolver isn't needed
+        get_resolver.assert_not_called()
+
+    def test_query_address_reused(self):
+        with (
+            patch("mcstatus.server.UDPSocketConnection") as connection,
+            patch("mcstatus.server.ServerQuerier"),
+            patch.object(self.server.address, "_resolve_ip") as resolve_ip,
+        ):
+            resolve_ip.return_value = "127.0.0.1"
+            self.server.query()
+            self.server.query()
+            resolve_ip.return_value = "127.0.0.2"
+            self.server.query()
+
+        first, second, third = (call.args[0] for call in connection.call_args_list)
+        assert first is second
+        assert third == ("127.0.0.2", 25565)
+
+    def test_full_info(self):
+        error = IOError("no response")
+        with (
+            patch.object(JavaServer, "status", side_effect=error),
+            patch.object(JavaServer, "query", return_value="query"),
+        ):
+            assert self.server.full_info() == (error, "query")
+
     def test_lookup_constructor(self):
         s = JavaServer.lookup("example.org:4444")
         assert s.address.host == "example.org"
         assert s.address.port == 4444
+
+    def test_lookup_cached(self):
+        JavaServer.clear_lookup_cache()
+        with patch("mcstatus.server._minecraft_srv_address_lookup") as srv_lookup:
+            srv_lookup.return_value = Address("mc.example.org", 12345)
+            first = JavaServer.lookup("example.org")
+            second = JavaServer.lookup("example.org")
+
+        srv_lookup.assert_called_once()
+        assert first.address == second.address == ("mc.example.org", 12345)
+
+    def test_lookup_uses_set_resolver(self):
+        JavaServer.clear_lookup_cache()
+        answer = Mock()
+        answer.target = "mc.example.org."
+        answer.port = 12345
+        resolver = Mock()
+        resolver.resolve.return_value = [answer]
+
+        JavaServer.set_resolver(resolver)
+        try:
+            s = JavaServer.lookup("example.org")
+        finally:
+            JavaServer.set_resolver(None, None)
+
+        resolver.resolve.assert_called_once_with("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+        assert s.address == ("mc.example.org", 12345)
+
+    def test_set_resolver_keeps_omitted_resolver(self):
+        resolver, async_resolver = Mock(), Mock()
+        try:
+            JavaServer.set_resolver(resolver, async_resolver)
+            JavaServer.set_resolver(async_resolver=None)
+
+            assert _get_resolver() is resolver
+            assert _get_async_resolver() is not async_resolver
+
+            JavaServer.set_resolver(None)
+            assert _get_resolver() is not resolver
+        finally:
+            JavaServer.set_resolver(None, None)
+
+    @pytest.mark.asyncio
+    async def test_lookup_in_event_loop_warning_points_at_caller(self):
+        JavaServer.clear_lookup_cache()
+        resolver = Mock()
+        resolver.resolve.side_effect = dns.resolver.NXDOMAIN
+        JavaServer.set_resolver(resolver)
+        try:
+            with pytest.warns(RuntimeWarning, match="blocks the running event loop") as record:
+                JavaServer.lookup("example.org")
+        finally:
+            JavaServer.set_resolver(None)
+            JavaServer.clear_lookup_cache()
+
+        assert record[0].filename == __file__
+
+    def test_lookup_cache_expires(self):
+        JavaServer.clear_lookup_cache()
+        with (
+            patch("mcstatus.server._minecraft_srv_address_lookup") as srv_lookup,
+            patch("mcstatus.server.time.monotonic") as monotonic,
+        ):
+            srv_lookup.return_value = Address("mc.example.org", 12345)
+            monotonic.return_value = 1000.0
+            JavaServer.lookup("example.org")
+            monotonic.return_value = 1000.0 + 301
+            JavaServer.lookup("example.org")
+
+        assert srv_lookup.call_count == 2
+
+    def test_status_many(self):
+        error = IOError("no response")
+
+        def fake_status(server, **kwargs):
+            if server.address.port == 2:
+                raise error
+            return f"status {server.address.port}"
+
+        with patch.object(JavaServer, "status", autospec=True, side_effect=fake_status):
+            results = JavaServer.status_many(["a.example.org:1", "b.example.org:2", "c.example.org:3"], concurrency=2)
+
+        assert results == [("a.example.org:1", "status 1"), ("b.example.org:2", error), ("c.example.org:3", "status 3")]
+
+    def test_lookup_cache_size_limit(self):
+        JavaServer.clear_lookup_cache()
+        with (
+            patch("mcstatus.server._SRV_CACHE_SIZE", 2),
+            patch("mcstatus.server._minecraft_srv_address_lookup") as srv_lookup,
+        ):
+            srv_lookup.return_value = Address("mc.example.org", 12345)
+            JavaServer.lookup("a.example.org")
+            JavaServer.lookup("b.example.org")
+            JavaServer.lookup("a.example.org")  # Makes b the least recently used one
+            JavaServer.lookup("c.example.org")
+            assert srv_lookup.call_count == 3
+
+            JavaServer.lookup("a.example.org")
+            assert srv_lookup.call_count == 3
+            JavaServer.lookup("b.example.org")
+            assert srv_lookup.call_count == 4
+
+    @pytest.mark.parametrize("address", ["1.2.3.4:25565", "1.2.3.4", "[::1]", "example.org:25565", "localhost"])
+    def test_lookup_without_dns_query_does_not_import_dnspython(self, address):
+        code = (
+            "import asyncio, sys; from mcstatus import JavaServer; "
+            f"JavaServer.lookup({address!r}); asyncio.run(JavaServer.async_lookup({address!r})); "
+            "assert 'dns.resolver' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lookup_without_srv(self):
+        with patch("mcstatus.server._minecraft_srv_address_lookup") as srv_lookup:
+            s = JavaServer.lookup("example.org", resolve_srv=False)
+
+        srv_lookup.assert_not_called()
+        assert s.address == ("example.org", 25565)
+
+    def test_from_resolved_constructor(self):
+        s = JavaServer.from_resolved("1.2.3.4", 4444)
+        assert s.address.host == "1.2.3.4"
+        assert s.address.port == 4444
+
+        with patch("dns.resolver.resolve") as resolve:
+            assert str(s.address.resolve_ip()) == "1.2.3.4"
+        resolve.assert_not_called()
+
+    def test_from_resolved_constructor_hostname(self):
+        with pytest.raises(ValueError):
+            JavaServer.from_resolved("example.org")
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from mcstatus.utils import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run():
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    flight: SingleFlight[int] = SingleFlight()
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [1] * 5
+
+    # Once the call finished, the next one starts a new run
+    assert await flight.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_different_keys_not_shared():
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+
+    flight: SingleFlight[None] = SingleFlight()
+    await asyncio.gather(flight.do("a", work), flight.do("b", work))
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_shared():
+    async def work():
+        await asyncio.sleep(0)
+        raise ValueError
+
+    flight: SingleFlight[None] = SingleFlight()
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_leader_does_not_cancel_followers():
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return 5
+
+    flight: SingleFlight[int] = SingleFlight()
+    leader = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == 5
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_call_cancelled_once_all_callers_cancelled():
+    started = asyncio.Event()
+    cancelled = False
+
+    async def work():
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    flight: SingleFlight[None] = SingleFlight()
+    callers = [asyncio.create_task(flight.do("key", work)) for _ in range(2)]
+    await started.wait()
+
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    assert not cancelled
+
+    callers[1].cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert cancelled
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import typing
 from asyncio.exceptions import TimeoutError
@@ -15,10 +17,17 @@ class FakeAsyncStream(asyncio.StreamReader):
         raise NotImplementedError("tests are designed to timeout before reaching this line")
 
 
-async def fake_asyncio_asyncio_open_connection(hostname: str, port: int):
+async def fake_asyncio_asyncio_open_connection(hostname: str, port: int, happy_eyeballs_delay: float | None = None):
     return FakeAsyncStream(), None
 
 
+async def fake_slow_asyncio_open_connection(
+    hostname: str, port: int, happy_eyeballs_delay: float | None = None
+) -> typing.NoReturn:
+    await asyncio.sleep(2)
+    raise NotImplementedError("tests are designed to timeout before reaching this line")
+
+
 class TestAsyncSocketConnection:
     @pytest.mark.asyncio
     async def test_tcp_socket_read(self):
@@ -26,3 +35,10 @@ class TestAsyncSocketConnection:
             async with TCPAsyncSocketConnection(Address("dummy_address", 1234), timeout=0.01) as tcp_async_socket:
                 with pytest.raises(TimeoutError):
                     await tcp_async_socket.read(10)
+
+    @pytest.mark.asyncio
+    async def test_tcp_socket_connect_timeout(self):
+        with patch("asyncio.open_connection", fake_slow_asyncio_open_connection):
+            tcp_async_socket = TCPAsyncSocketConnection(Address("dummy_address", 1234), timeout=5, connect_timeout=0.01)
+            with pytest.raises(TimeoutError):
+                await tcp_async_socket.connect()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+import mcstatus
+from mcstatus.address import Address
+from mcstatus.protocol.connection import TCPAsyncSocketConnection
+
+
+class FakeEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+@pytest.fixture
+def fake_uvloop():
+    module = types.ModuleType("uvloop")
+    module.EventLoopPolicy = FakeEventLoopPolicy  # type: ignore[attr-defined]
+    with patch.dict(sys.modules, {"uvloop": module}):
+        yield module
+
+
+def reload_mcstatus(monkeypatch: pytest.MonkeyPatch, env_value: str | None) -> asyncio.AbstractEventLoopPolicy | None:
+    """Re-run the import of mcstatus with given value of the env var, returning the event loop policy it set (if any)."""
+    if env_value is None:
+        monkeypatch.delenv("MCSTATUS_UVLOOP", raising=False)
+    else:
+        monkeypatch.setenv("MCSTATUS_UVLOOP", env_value)
+
+    with patch("asyncio.set_event_loop_policy") as set_event_loop_policy:
+        importlib.reload(mcstatus)
+
+    if not set_event_loop_policy.called:
+        return None
+    return set_event_loop_policy.call_args.args[0]
+
+
+def test_uvloop_policy_set_when_enabled(monkeypatch, fake_uvloop):
+    assert isinstance(reload_mcstatus(monkeypatch, "1"), FakeEventLoopPolicy)
+
+
+@pytest.mark.parametrize("env_value", [None, "0", ""])
+def test_uvloop_policy_not_set_when_disabled(monkeypatch, fake_uvloop, env_value):
+    assert reload_mcstatus(monkeypatch, env_value) is None
+
+
+def test_uvloop_policy_not_set_without_uvloop(monkeypatch):
+    # A None entry in sys.modules makes the import raise ImportError, as if uvloop wasn't installed
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert reload_mcstatus(monkeypatch, "1") is None
+
+
+@pytest.mark.asyncio
+async def test_tcp_connection_with_uvloop_style_create_connection():
+    loop = asyncio.get_running_loop()
+    real_create_connection = loop.create_connection
+
+    # Like uvloop, this doesn't accept the happy_eyeballs_delay argument (or any other unknown one)
+    async def create_connection(protocol_factory, host=None, port=None, *, ssl=None, family=0, proto=0, flags=0):
+        return await real_create_connection(protocol_factory, host, port, ssl=ssl, family=family, proto=proto, flags=flags)
+
+    async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(await reader.read(2))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(echo, "127.0.0.1", 0)
+    try:
+        port = server.sockets[0].getsockname()[1]
+        with patch.object(loop, "create_connection", create_connection):
+            async with TCPAsyncSocketConnection(Address("127.0.0.1", port), timeout=1) as connection:
+                connection.write(bytearray.fromhex("7FAA"))
+                assert await connection.read(2) == bytearray.fromhex("7FAA")
+    finally:
+        server.close()
+        await server.wait_closed()